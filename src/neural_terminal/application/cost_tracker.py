@@ -11,6 +11,31 @@ from neural_terminal.application.events import DomainEvent, EventBus, EventObser
 from neural_terminal.domain.models import TokenUsage
 from neural_terminal.infrastructure.openrouter import OpenRouterModel
 
+# Estimated streaming cost is checked against the budget this often
+_BUDGET_CHECK_INTERVAL = 100
+
+# Prices are held as integer pico-dollars (1e-12 USD) per 1K tokens, so
+# tokens * price is an exact integer in femto-dollars (1e-15 USD) without
+# dividing by 1000 per message. Per-token prices below a nano-dollar
+# still accrue instead of rounding to zero.
+_PICO_PER_USD = 10**12
+_FEMTO_PER_USD = 10**15
+
+
+def _price_to_pico(usd_per_1k: Decimal) -> int:
+    """Convert a USD per 1K tokens price to whole pico-dollars per 1K."""
+    return round(usd_per_1k * _PICO_PER_USD)
+
+
+def _to_femto(usd: Decimal) -> int:
+    """Convert a USD amount to whole femto-dollars."""
+    return round(usd * _FEMTO_PER_USD)
+
+
+def _from_femto(femto: int) -> Decimal:
+    """Convert whole femto-dollars back to a USD Decimal."""
+    return Decimal(femto) / _FEMTO_PER_USD if femto else Decimal("0.00")
+
 
 class CostTracker(EventObserver):
     """Real-time cost accumulator with budget enforcement.
@@ -26,6 +51,11 @@ class CostTracker(EventObserver):
         budget_limit: Optional budget limit in USD
     """
     
+    # on_event only updates local counters and integer totals, and the
+    # budget events it emits go through the bus's own error isolation,
+    # so EventBus can call it without a try/except wrapper.
+    __nothrow__ = True
+    
     def __init__(self, event_bus: EventBus, budget_limit: Optional[Decimal] = None):
         """Initialize cost tracker.
         
@@ -34,11 +64,22 @@ class CostTracker(EventObserver):
             budget_limit: Optional budget limit in USD
         """
         self._bus = event_bus  # Injected singleton - use this!
-        self._accumulated = Decimal("0.00")
+        self._accumulated_femto = 0
         self._budget_limit = budget_limit
+        self._budget_limit_femto = (
+            _to_femto(budget_limit) if budget_limit is not None else None
+        )
         self._current_model_price: Optional[OpenRouterModel] = None
+        self._prompt_pico_per_1k = 0
+        self._completion_pico_per_1k = 0
         self._estimated_tokens = 0
+        self._tokens_until_check = _BUDGET_CHECK_INTERVAL
         self._is_tracking = False
+        self._dispatch = {
+            Events.MESSAGE_STARTED: self._on_message_started,
+            Events.TOKEN_GENERATED: self._on_token_generated,
+            Events.MESSAGE_COMPLETED: self._on_message_completed,
+        }
     
     def set_model(self, model: OpenRouterModel) -> None:
         """Set current pricing model for estimation.
@@ -47,6 +88,14 @@ class CostTracker(EventObserver):
             model: OpenRouter model with pricing
         """
         self._current_model_price = model
+        # Prices are quoted in USD per 1K tokens; convert once here to
+        # integer pico-dollars per 1K tokens for all later arithmetic
+        self._prompt_pico_per_1k = _price_to_pico(
+            model.prompt_price or Decimal("0")
+        )
+        self._completion_pico_per_1k = _price_to_pico(
+            model.completion_price or Decimal("0")
+        )
     
     def on_event(self, event: DomainEvent) -> None:
         """Handle domain events for cost tracking.
@@ -54,77 +103,89 @@ class CostTracker(EventObserver):
         Args:
             event: Domain event to process
         """
-        if event.event_type == Events.MESSAGE_STARTED:
-            self._is_tracking = True
-            self._estimated_tokens = 0
-        
-        elif event.event_type == Events.TOKEN_GENERATED:
-            # Estimate cost during streaming (rough approximation)
-            self._estimated_tokens += 1
-            # Check budget every 100 tokens
-            if self._estimated_tokens % 100 == 0:
-                self._check_budget(self._estimate_current_cost())
-        
-        elif event.event_type == Events.MESSAGE_COMPLETED:
-            # Reconcile with actual usage from API
-            usage = event.payload.get("usage") if event.payload else None
-            if usage and isinstance(usage, TokenUsage):
-                actual_cost = self._calculate_actual_cost(usage)
-                self._accumulated += actual_cost
-                self._is_tracking = False
-                
-                # Final budget check
-                if self._budget_limit and self._accumulated > self._budget_limit:
-                    self._emit_budget_exceeded()
-    
-    def _estimate_current_cost(self) -> Decimal:
+        handler = self._dispatch.get(event.event_type)
+        if handler is not None:
+            handler(event)
+    
+    def _on_message_started(self, event: DomainEvent) -> None:
+        """Start tracking a new streamed message."""
+        self._is_tracking = True
+        self._estimated_tokens = 0
+        self._tokens_until_check = _BUDGET_CHECK_INTERVAL
+    
+    def _on_token_generated(self, event: DomainEvent) -> None:
+        """Estimate cost during streaming (rough approximation)."""
+        # Batched events report how many tokens they cover; the delta
+        # text itself is never needed here
+        count = payload.get("count", 1) if (payload := event.payload) else 1
+        self._estimated_tokens += count
+        # Check budget every 100 tokens, counting down to the next check
+        remaining = self._tokens_until_check - count
+        if remaining > 0:
+            self._tokens_until_check = remaining
+        else:
+            self._tokens_until_check = (
+                remaining % _BUDGET_CHECK_INTERVAL or _BUDGET_CHECK_INTERVAL
+            )
+            self._check_budget(self._estimate_current_cost())
+    
+    def _on_message_completed(self, event: DomainEvent) -> None:
+        """Reconcile with actual usage from API."""
+        if (payload := event.payload) and isinstance(
+            usage := payload.get("usage"), TokenUsage
+        ):
+            self._accumulated_femto += self._calculate_actual_cost(usage)
+            self._is_tracking = False
+            
+            # Final budget check
+            if (
+                self._budget_limit
+                and self._accumulated_femto > self._budget_limit_femto
+            ):
+                self._emit_budget_exceeded()
+    
+    def _estimate_current_cost(self) -> int:
         """Estimate cost during streaming.
         
         Returns:
-            Estimated cost based on current token count
+            Estimated cost in femto-dollars based on current token count
         """
-        if not self._current_model_price or not self._current_model_price.completion_price:
-            return Decimal("0")
-        
-        return (Decimal(self._estimated_tokens) / 1000) * self._current_model_price.completion_price
+        return self._estimated_tokens * self._completion_pico_per_1k
     
-    def _calculate_actual_cost(self, usage: TokenUsage) -> Decimal:
+    def _calculate_actual_cost(self, usage: TokenUsage) -> int:
         """Calculate precise cost from usage.
         
         Args:
             usage: Token usage from API
             
         Returns:
-            Actual cost in USD
+            Actual cost in femto-dollars
         """
-        if not self._current_model_price:
-            return Decimal("0")
-        
-        prompt_price = self._current_model_price.prompt_price or Decimal("0")
-        completion_price = self._current_model_price.completion_price or Decimal("0")
-        
-        return usage.calculate_cost(prompt_price, completion_price)
+        return (
+            usage.prompt_tokens * self._prompt_pico_per_1k
+            + usage.completion_tokens * self._completion_pico_per_1k
+        )
     
-    def _check_budget(self, estimated_cost: Decimal) -> None:
+    def _check_budget(self, estimated_cost: int) -> None:
         """Check if approaching budget limit and emit events.
         
         Args:
-            estimated_cost: Current estimated cost
+            estimated_cost: Current estimated cost in femto-dollars
         """
         if not self._budget_limit:
             return
         
-        projected = self._accumulated + estimated_cost
+        projected = self._accumulated_femto + estimated_cost
         
-        if projected > self._budget_limit:
+        if projected > self._budget_limit_femto:
             self._emit_budget_exceeded()
-        elif projected > self._budget_limit * Decimal("0.8"):
+        elif projected * 5 > self._budget_limit_femto * 4:
             # Emit warning at 80%
             self._bus.emit(DomainEvent(
                 event_type=Events.BUDGET_THRESHOLD,
                 conversation_id=None,
                 payload={
-                    "accumulated": str(self._accumulated),
+                    "accumulated": str(self.accumulated_cost),
                     "limit": str(self._budget_limit),
                 }
             ))
@@ -134,14 +195,14 @@ class CostTracker(EventObserver):
         self._bus.emit(DomainEvent(
             event_type=Events.BUDGET_EXCEEDED,
             conversation_id=None,
-            payload={"accumulated": str(self._accumulated)}
+            payload={"accumulated": str(self.accumulated_cost)}
         ))
     
     @property
     def accumulated_cost(self) -> Decimal:
         """Get accumulated cost."""
-        return self._accumulated
+        return _from_femto(self._accumulated_femto)
     
     def reset(self) -> None:
         """Reset accumulated cost."""
-        self._accumulated = Decimal("0.00")
+        self._accumulated_femto = 0
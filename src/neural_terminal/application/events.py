@@ -2,13 +2,20 @@
 
 Implements Observer pattern with typed event bus.
 """
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections import Counter, deque
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
+from neural_terminal.infrastructure.logger import get_logger
 
-@dataclass(frozen=True)
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """Immutable domain event.
     
@@ -20,6 +27,34 @@ class DomainEvent:
     event_type: str
     conversation_id: Optional[UUID] = None
     payload: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self) -> None:
+        # Intern so subscriber lookups hit the identity fast path even
+        # when the type string was built at runtime.
+        object.__setattr__(self, "event_type", sys.intern(self.event_type))
+    
+    @classmethod
+    def token(
+        cls, delta: str, conversation_id: Optional[UUID] = None
+    ) -> "DomainEvent":
+        """Build a TOKEN_GENERATED event for one streamed delta.
+        
+        Skips the generated ``__init__``/``__post_init__`` pair since the
+        event type is a known interned constant. Used once per streamed
+        token, so the saving adds up.
+        
+        Args:
+            delta: Token text
+            conversation_id: Optional conversation context
+            
+        Returns:
+            Event with payload ``{"delta": delta}``
+        """
+        event = cls.__new__(cls)
+        object.__setattr__(event, "event_type", Events.TOKEN_GENERATED)
+        object.__setattr__(event, "conversation_id", conversation_id)
+        object.__setattr__(event, "payload", {"delta": delta})
+        return event
 
 
 class EventObserver(ABC):
@@ -35,6 +70,43 @@ class EventObserver(ABC):
         raise NotImplementedError
 
 
+EventHandler = Callable[[DomainEvent], None]
+
+# Recycled TOKEN_GENERATED events for EventBus.emit_token_fast
+_TOKEN_EVENT_POOL: "deque[DomainEvent]" = deque(maxlen=64)
+
+
+def _as_handler(
+    observer: Union[EventObserver, EventHandler], error_message: str
+) -> EventHandler:
+    """Resolve an observer to the callable invoked on emit.
+    
+    Anything with an ``on_event`` method is stored as that bound method,
+    so emit does not repeat the attribute lookup per event. Plain
+    callables are accepted as-is.
+    
+    Unless the observer sets ``__nothrow__ = True``, the callable is
+    wrapped so that exceptions are logged instead of propagating.
+    
+    Args:
+        observer: Observer instance or callable taking the event
+        error_message: Log message used when the observer raises
+    """
+    on_event = getattr(observer, "on_event", None)
+    handler = on_event if on_event is not None else observer
+    if getattr(observer, "__nothrow__", False):
+        return handler
+    
+    def safe_handler(event: DomainEvent) -> None:
+        try:
+            handler(event)
+        except Exception:
+            # Log but don't stop propagation
+            logger.exception(error_message, event_type=event.event_type)
+    
+    return safe_handler
+
+
 class EventBus:
     """Thread-safe event bus for decoupled communication.
     
@@ -42,31 +114,44 @@ class EventBus:
     - Typed subscribers (specific event types)
     - Global subscribers (all events)
     - Error isolation (subscriber failures don't stop propagation)
+    - Per-type emit counts (see ``event_count``)
+    
+    Handlers are kept in immutable tuples rebuilt on subscribe, so emit
+    iterates a snapshot that concurrent subscriptions cannot mutate.
+    Error isolation is applied at subscribe time; observers declaring
+    ``__nothrow__ = True`` are called without it.
     """
     
     def __init__(self):
         """Initialize empty subscriber registry."""
-        self._subscribers: Dict[str, List[EventObserver]] = {}
-        self._global_subscribers: List[EventObserver] = []
+        self._handlers: Dict[str, Tuple[EventHandler, ...]] = {}
+        self._global_handlers: Tuple[EventHandler, ...] = ()
+        self._counts: Counter[str] = Counter()
+        self._counts_lock = threading.Lock()
     
-    def subscribe(self, event_type: str, observer: EventObserver) -> None:
+    def subscribe(
+        self, event_type: str, observer: Union[EventObserver, EventHandler]
+    ) -> None:
         """Subscribe to a specific event type.
         
         Args:
             event_type: Event type to subscribe to
-            observer: Observer instance
+            observer: Observer instance or callable taking the event
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(observer)
+        event_type = sys.intern(event_type)
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (
+            _as_handler(observer, "Event handler error"),
+        )
     
-    def subscribe_all(self, observer: EventObserver) -> None:
+    def subscribe_all(self, observer: Union[EventObserver, EventHandler]) -> None:
         """Subscribe to all events.
         
         Args:
-            observer: Observer instance
+            observer: Observer instance or callable taking the event
         """
-        self._global_subscribers.append(observer)
+        self._global_handlers += (
+            _as_handler(observer, "Global event handler error"),
+        )
     
     def emit(self, event: DomainEvent) -> None:
         """Emit an event to all subscribers.
@@ -77,33 +162,111 @@ class EventBus:
         Args:
             event: Event to emit
         """
+        # Streams emit from several threads; += on a Counter is a
+        # read-modify-write that would otherwise lose counts
+        with self._counts_lock:
+            self._counts[event.event_type] += 1
+        
         # Notify specific subscribers
-        for observer in self._subscribers.get(event.event_type, []):
-            try:
-                observer.on_event(event)
-            except Exception as e:
-                # Log but don't stop propagation
-                print(f"Event handler error: {e}")
+        for handler in self._handlers.get(event.event_type, ()):
+            handler(event)
         
         # Notify global subscribers
-        for observer in self._global_subscribers:
-            try:
-                observer.on_event(event)
-            except Exception as e:
-                print(f"Global handler error: {e}")
+        for handler in self._global_handlers:
+            handler(event)
+    
+    def event_count(self, event_type: str) -> int:
+        """Get how many events of a type have been emitted.
+        
+        Cheaper than a ``subscribe_all`` observer when all a caller needs
+        is whether (or how often) an event fired. A batched
+        TOKEN_GENERATED event counts once.
+        
+        Args:
+            event_type: Event type to look up
+            
+        Returns:
+            Number of emits of that type on this bus
+        """
+        return self._counts.get(event_type, 0)
+    
+    def emit_token(
+        self, delta: str, conversation_id: Optional[UUID] = None
+    ) -> None:
+        """Emit a TOKEN_GENERATED event for one streamed delta.
+        
+        Args:
+            delta: Token text
+            conversation_id: Optional conversation context
+        """
+        self.emit(DomainEvent.token(delta, conversation_id))
+    
+    def emit_token_fast(
+        self, delta: str, conversation_id: Optional[UUID] = None
+    ) -> None:
+        """Emit a TOKEN_GENERATED event using a recycled event object.
+        
+        The event and its payload dict come from a small freelist and go
+        back to it once dispatch returns, so steady-state streaming
+        allocates nothing per token. Only use this when every
+        TOKEN_GENERATED observer (and every global observer) handles the
+        event synchronously and keeps no reference to it or its payload;
+        otherwise use ``emit_token``.
+        
+        Args:
+            delta: Token text
+            conversation_id: Optional conversation context
+        """
+        try:
+            event = _TOKEN_EVENT_POOL.pop()
+        except IndexError:
+            event = DomainEvent.token(delta, conversation_id)
+        else:
+            event.payload["delta"] = delta
+            object.__setattr__(event, "conversation_id", conversation_id)
+        try:
+            self.emit(event)
+        finally:
+            _TOKEN_EVENT_POOL.append(event)
+    
+    def emit_token_batch(
+        self, deltas: List[str], conversation_id: Optional[UUID] = None
+    ) -> None:
+        """Emit one TOKEN_GENERATED event covering several deltas.
+        
+        The payload carries ``count`` and ``deltas`` instead of a single
+        ``delta``; observers should read ``payload.get("count", 1)``.
+        Nothing is emitted for an empty batch.
+        
+        Args:
+            deltas: Token texts, in stream order
+            conversation_id: Optional conversation context
+        """
+        if not deltas:
+            return
+        self.emit(DomainEvent(
+            event_type=Events.TOKEN_GENERATED,
+            conversation_id=conversation_id,
+            payload={"count": len(deltas), "deltas": deltas},
+        ))
 
 
 class Events:
-    """Standard event type constants."""
+    """Standard event type constants.
+    
+    Values are interned: they contain dots, so CPython would not intern
+    them automatically, and interning lets dict lookups in EventBus match
+    by identity.
+    """
     
     # Message lifecycle
-    MESSAGE_STARTED = "message.started"
-    TOKEN_GENERATED = "token.generated"
-    MESSAGE_COMPLETED = "message.completed"
+    MESSAGE_STARTED = sys.intern("message.started")
+    TOKEN_GENERATED = sys.intern("token.generated")
+    MESSAGE_COMPLETED = sys.intern("message.completed")
     
     # Budget
-    BUDGET_THRESHOLD = "budget.threshold"
-    BUDGET_EXCEEDED = "budget.exceeded"
+    BUDGET_THRESHOLD = sys.intern("budget.threshold")
+    BUDGET_EXCEEDED = sys.intern("budget.exceeded")
     
     # Context
-    CONTEXT_TRUNCATED = "context.truncated"
+    CONTEXT_TRUNCATED = sys.intern("context.truncated")
@@ -3,9 +3,12 @@
 Coordinates between repositories, external APIs, and event system.
 """
 
+import io
+import json
 import time
+from datetime import datetime
 from decimal import Decimal
-from typing import AsyncGenerator, Dict, List, Optional, Tuple
+from typing import IO, Any, AsyncGenerator, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from neural_terminal.application.events import DomainEvent, EventBus, Events
@@ -21,10 +24,63 @@ from neural_terminal.infrastructure.openrouter import OpenRouterClient, OpenRout
 from neural_terminal.infrastructure.repositories import ConversationRepository
 from neural_terminal.infrastructure.token_counter import TokenCounter
 
+try:  # Optional: faster JSON export
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
 # Configure logging
 configure_logging(settings.log_level)
 logger = get_logger(__name__)
 
+# Streamed deltas are reported to the event bus in batches of this size
+_TOKEN_BATCH_SIZE = 32
+
+
+# Per-message role strings for export, resolved once instead of per message
+_ROLE_STR: Dict[MessageRole, str] = {role: role.value for role in MessageRole}
+_ROLE_LABEL: Dict[MessageRole, str] = {
+    role: role.value.capitalize() for role in MessageRole
+}
+
+
+def _dumps_export(data: Any) -> bytes:
+    """Serialize export data as indented JSON bytes.
+
+    Output matches json.dumps(data, indent=2) with datetimes written as
+    isoformat(), including its \\uXXXX escaping of non-ASCII text. orjson
+    cannot escape, so its output is used only when it is pure ASCII;
+    anything else goes through the stdlib encoder.
+    """
+    if orjson is not None:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        if encoded.isascii():
+            return encoded
+    return json.dumps(data, indent=2, default=_isoformat_default).encode("ascii")
+
+
+def _isoformat_default(obj: Any) -> str:
+    """json.dumps hook rendering datetimes the way orjson does."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _export_message(msg: Message) -> Dict[str, Any]:
+    """Build the JSON export record for one message.
+
+    Datetimes are left for the encoder to format, so orjson renders them
+    in C rather than through a Python-level isoformat() call per message.
+    """
+    return {
+        "id": str(msg.id),
+        "role": _ROLE_STR[msg.role],
+        "content": msg.content,
+        "timestamp": msg.created_at,
+        "model_id": msg.model_id,
+        "latency_ms": msg.latency_ms,
+    }
+
 
 class ChatOrchestrator:
     """Domain service managing conversation lifecycle.
@@ -231,6 +287,7 @@ class ChatOrchestrator:
 
         # Streaming
         assistant_content = ""
+        pending_deltas: List[str] = []
         final_usage: Optional[TokenUsage] = None
         latency_ms = 0
 
@@ -248,14 +305,13 @@ class ChatOrchestrator:
                     delta = chunk["content"]
                     assistant_content += delta
 
-                    # Emit token event for cost tracking
-                    self._event_bus.emit(
-                        DomainEvent(
-                            event_type=Events.TOKEN_GENERATED,
-                            conversation_id=conversation_id,
-                            payload={"delta": delta},
+                    # Emit token events for cost tracking, one per batch
+                    pending_deltas.append(delta)
+                    if len(pending_deltas) >= _TOKEN_BATCH_SIZE:
+                        self._event_bus.emit_token_batch(
+                            pending_deltas, conversation_id
                         )
-                    )
+                        pending_deltas = []
 
                     logger.debug("Yielding delta", delta_length=len(delta))
                     yield (delta, None)
@@ -269,6 +325,8 @@ class ChatOrchestrator:
                         latency_ms=latency_ms,
                     )
 
+            self._event_bus.emit_token_batch(pending_deltas, conversation_id)
+
             # Record success
             self._circuit._on_success()
 
@@ -385,6 +443,28 @@ class ChatOrchestrator:
         Returns:
             Exported conversation as string
 
+        Raises:
+            ConversationNotFoundError: If conversation doesn't exist
+            ValueError: If format is not supported
+        """
+        buffer = io.BytesIO()
+        self.export_conversation_stream(conversation_id, buffer, format)
+        return buffer.getvalue().decode("utf-8")
+
+    def export_conversation_stream(
+        self, conversation_id: UUID, out: IO[bytes], format: str = "json"
+    ) -> None:
+        """Write a conversation export to a binary stream.
+
+        Messages are serialized and written one at a time, so memory use
+        does not grow with conversation length. Output is byte-for-byte
+        what export_conversation() returns, UTF-8 encoded.
+
+        Args:
+            conversation_id: Conversation ID to export
+            out: Writable binary stream
+            format: Export format ("json" or "markdown")
+
         Raises:
             ConversationNotFoundError: If conversation doesn't exist
             ValueError: If format is not supported
@@ -398,45 +478,39 @@ class ChatOrchestrator:
         if not conv:
             raise ConversationNotFoundError(str(conversation_id))
 
-        messages = self._repo.get_messages(conversation_id)
+        messages = self._repo.iter_messages(conversation_id)
 
         if format == "json":
-            import json
-            from datetime import datetime
-
-            export_data = {
-                "id": str(conv.id),
-                "title": conv.title,
-                "model_id": conv.model_id,
-                "created_at": conv.created_at.isoformat() if conv.created_at else None,
-                "updated_at": conv.updated_at.isoformat() if conv.updated_at else None,
-                "total_cost": str(conv.total_cost),
-                "total_tokens": conv.total_tokens,
-                "status": conv.status.value,
-                "messages": [
-                    {
-                        "id": str(msg.id),
-                        "role": msg.role.value,
-                        "content": msg.content,
-                        "timestamp": msg.created_at.isoformat()
-                        if msg.created_at
-                        else None,
-                        "model_id": msg.model_id,
-                        "latency_ms": msg.latency_ms,
-                    }
-                    for msg in messages
-                ],
-            }
-            return json.dumps(export_data, indent=2)
+            header = _dumps_export(
+                {
+                    "id": str(conv.id),
+                    "title": conv.title,
+                    "model_id": conv.model_id,
+                    "created_at": conv.created_at,
+                    "updated_at": conv.updated_at,
+                    "total_cost": str(conv.total_cost),
+                    "total_tokens": conv.total_tokens,
+                    "status": conv.status.value,
+                    "messages": [],
+                }
+            )
+            # Split the document around the empty array and write each
+            # message between the halves at the array's indent depth. JSON
+            # strings never hold raw newlines, so re-indenting is safe.
+            head, _, tail = header.rpartition(b'"messages": []')
+            out.write(head + b'"messages": [')
+            separator = b"\n    "
+            for msg in messages:
+                out.write(separator)
+                out.write(_dumps_export(_export_message(msg)).replace(b"\n", b"\n    "))
+                separator = b",\n    "
+            if separator != b"\n    ":
+                out.write(b"\n  ")
+            out.write(b"]" + tail)
 
         elif format == "markdown":
-            lines = [f"# {conv.title}", ""]
-
+            out.write(f"# {conv.title}\n".encode("utf-8"))
             for msg in messages:
-                role_label = msg.role.value.capitalize()
-                lines.append(f"## {role_label}")
-                lines.append("")
-                lines.append(msg.content)
-                lines.append("")
-
-            return "\n".join(lines)
+                out.write(
+                    f"\n## {_ROLE_LABEL[msg.role]}\n\n{msg.content}\n".encode("utf-8")
+                )
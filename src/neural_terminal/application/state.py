@@ -3,15 +3,15 @@
 Provides type-safe abstraction over st.session_state with namespace
 isolation to prevent key collisions.
 """
-from dataclasses import asdict, dataclass, field
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, MutableMapping, Optional
 
 import streamlit as st
 
 from neural_terminal.domain.models import Conversation
 
 
-@dataclass
+@dataclass(slots=True)
 class AppState:
     """Immutable application state container.
     
@@ -31,8 +31,12 @@ class AppState:
     error_message: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for session storage."""
-        return asdict(self)
+        """Convert to dictionary for session storage.
+        
+        All fields are immutable scalars, so a shallow copy is enough;
+        dataclasses.asdict would deep-copy every value.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AppState":
@@ -55,17 +59,26 @@ class StateManager:
     
     _NAMESPACE = "neural_terminal_"
     
-    def __init__(self):
-        """Initialize state manager with namespace."""
+    def __init__(self, session_state: Optional[MutableMapping[str, Any]] = None):
+        """Initialize state manager with namespace.
+        
+        Args:
+            session_state: Mapping to store state in. Defaults to
+                st.session_state, which resolves to the current session on
+                every access; tests can pass a plain dict.
+        """
+        self._session_state = (
+            session_state if session_state is not None else st.session_state
+        )
         self._ensure_initialized()
     
     def _ensure_initialized(self) -> None:
         """Idempotent initialization of session state."""
         init_key = f"{self._NAMESPACE}initialized"
-        if init_key not in st.session_state:
-            st.session_state[init_key] = True
-            st.session_state[f"{self._NAMESPACE}state"] = AppState().to_dict()
-            st.session_state[f"{self._NAMESPACE}conversation_cache"] = {}
+        if init_key not in self._session_state:
+            self._session_state[init_key] = True
+            self._session_state[f"{self._NAMESPACE}state"] = AppState().to_dict()
+            self._session_state[f"{self._NAMESPACE}conversation_cache"] = {}
     
     @property
     def state(self) -> AppState:
@@ -74,7 +87,7 @@ class StateManager:
         Returns:
             AppState instance
         """
-        raw = st.session_state.get(f"{self._NAMESPACE}state", {})
+        raw = self._session_state.get(f"{self._NAMESPACE}state", {})
         return AppState.from_dict(raw)
     
     def update(self, **kwargs) -> None:
@@ -85,7 +98,7 @@ class StateManager:
         """
         current = self.state
         new_state = AppState(**{**current.to_dict(), **kwargs})
-        st.session_state[f"{self._NAMESPACE}state"] = new_state.to_dict()
+        self._session_state[f"{self._NAMESPACE}state"] = new_state.to_dict()
     
     def set_conversation(self, conversation: Conversation) -> None:
         """Cache conversation in session state.
@@ -97,12 +110,12 @@ class StateManager:
             conversation: Conversation to cache
         """
         cache_key = f"{self._NAMESPACE}conversation_cache"
-        if cache_key not in st.session_state:
-            st.session_state[cache_key] = {}
+        if cache_key not in self._session_state:
+            self._session_state[cache_key] = {}
         
         # Serialize conversation properly
         conv_data = conversation.to_dict()
-        st.session_state[cache_key][str(conversation.id)] = conv_data
+        self._session_state[cache_key][str(conversation.id)] = conv_data
         
         # Update current conversation ID
         self.update(current_conversation_id=str(conversation.id))
@@ -117,7 +130,7 @@ class StateManager:
             Conversation or None if not cached
         """
         cache_key = f"{self._NAMESPACE}conversation_cache"
-        cache = st.session_state.get(cache_key, {})
+        cache = self._session_state.get(cache_key, {})
         data = cache.get(conversation_id)
         
         if data:
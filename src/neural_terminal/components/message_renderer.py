@@ -4,10 +4,11 @@ Provides secure HTML rendering for chat messages with configurable
 allowlists and automatic code block detection.
 """
 
+import hashlib
 import re
 import html
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Callable, Any
 from decimal import Decimal
 
 import bleach
@@ -53,9 +54,12 @@ ALLOWED_ATTRIBUTES: Dict[str, List[str]] = {
 ALLOWED_PROTOCOLS = ["http", "https", "mailto"]
 
 
-@dataclass(frozen=True)
-class CodeBlock:
-    """Represents a detected code block."""
+class CodeBlock(NamedTuple):
+    """Represents a detected code block.
+
+    A NamedTuple rather than a dataclass keeps cached parse results to a
+    single tuple allocation per block.
+    """
 
     language: Optional[str]
     code: str
@@ -118,6 +122,58 @@ class MessageSanitizer:
         return html.escape(text)
 
 
+class _FencedBlockCache:
+    """Bounded LRU cache of parsed blocks keyed by a digest of the text.
+
+    Entries are stored under a 16-byte BLAKE2b digest rather than the raw
+    message, so the cache neither retains multi-KB strings nor compares
+    them in full on lookup. Membership and item access accept the raw text.
+    """
+
+    def __init__(self, max_size: int):
+        """Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries to keep
+        """
+        self._max_size: int = max_size
+        self._entries: "OrderedDict[bytes, List[CodeBlock]]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        """Compute the fixed-size cache key for text."""
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, text: str) -> Optional[List[CodeBlock]]:
+        """Return cached blocks for text and mark them most recently used."""
+        key = self._key(text)
+        blocks = self._entries.get(key)
+        if blocks is not None:
+            self._entries.move_to_end(key)
+        return blocks
+
+    def put(self, text: str, blocks: List[CodeBlock]) -> None:
+        """Store blocks for text, evicting least recently used entries."""
+        self._entries[self._key(text)] = blocks
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __contains__(self, text: object) -> bool:
+        return isinstance(text, str) and self._key(text) in self._entries
+
+    def __getitem__(self, text: str) -> List[CodeBlock]:
+        return self._entries[self._key(text)]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class CodeBlockParser:
     """Parser for detecting and extracting code blocks.
 
@@ -142,9 +198,8 @@ class CodeBlockParser:
         if max_cache_size < 0:
             raise ValueError("max_cache_size must be non-negative")
 
-        self._max_cache_size = max_cache_size
-        # Use OrderedDict for LRU behavior
-        self._fenced_cache: Dict[str, List[CodeBlock]] = {}
+        self._max_cache_size: int = max_cache_size
+        self._fenced_cache: _FencedBlockCache = _FencedBlockCache(max_cache_size)
 
     def parse_fenced_blocks(self, text: str) -> List[CodeBlock]:
         """Extract fenced code blocks from text.
@@ -155,16 +210,18 @@ class CodeBlockParser:
         Returns:
             List of detected code blocks
         """
+        # Most messages have no fences; a substring scan is cheaper than
+        # hashing the text for a cache lookup
+        if "```" not in text:
+            return []
+
         # Check cache first
-        if text in self._fenced_cache:
-            # Move to end (most recently used)
-            result = self._fenced_cache[text]
-            del self._fenced_cache[text]
-            self._fenced_cache[text] = result
-            return result
+        cached = self._fenced_cache.get(text)
+        if cached is not None:
+            return cached
 
         # Parse blocks
-        blocks = []
+        blocks: List[CodeBlock] = []
         for match in self.FENCED_PATTERN.finditer(text):
             language = match.group(1).strip() or None
             code = match.group(2).strip()
@@ -180,13 +237,7 @@ class CodeBlockParser:
 
         # Cache the result if caching is enabled
         if self._max_cache_size > 0:
-            self._fenced_cache[text] = blocks
-
-            # LRU eviction: remove oldest items if over limit
-            while len(self._fenced_cache) > self._max_cache_size:
-                # Remove first item (oldest)
-                first_key = next(iter(self._fenced_cache))
-                del self._fenced_cache[first_key]
+            self._fenced_cache.put(text, blocks)
 
         return blocks
 
@@ -199,7 +250,7 @@ class CodeBlockParser:
         Returns:
             List of inline code blocks
         """
-        blocks = []
+        blocks: List[CodeBlock] = []
         for match in self.INLINE_PATTERN.finditer(text):
             blocks.append(
                 CodeBlock(
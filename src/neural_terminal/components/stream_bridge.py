@@ -11,7 +11,7 @@ Phase 0 Defect H-3 Fix:
 import asyncio
 import queue
 import threading
-from typing import Any, Callable, Coroutine, Optional, TypeVar
+from typing import Any, Callable, Coroutine, List, Optional, TypeVar
 
 T = TypeVar("T")
 
@@ -109,7 +109,9 @@ class StreamlitStreamBridge:
 
         Phase 4: Thread Safety - Includes lock for safe concurrent access.
         """
-        self._buffer = ""
+        # Deltas are collected and joined on read: str += on an attribute
+        # copies the whole buffer per delta
+        self._chunks: List[str] = []
         self._queue: queue.Queue = queue.Queue()
         self._is_running = False
         self._error: Optional[str] = None
@@ -164,7 +166,7 @@ class StreamlitStreamBridge:
                 msg_type, data = self._queue.get(timeout=0.1)
 
                 if msg_type == "delta":
-                    self._buffer += data
+                    self._chunks.append(data)
                     if on_delta:
                         on_delta(data)
 
@@ -190,4 +192,4 @@ class StreamlitStreamBridge:
     @property
     def content(self) -> str:
         """Get accumulated content."""
-        return self._buffer
+        return "".join(self._chunks)
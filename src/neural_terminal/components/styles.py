@@ -4,12 +4,17 @@ Provides utilities for generating and injecting custom CSS into Streamlit,
 creating the terminal aesthetic UI.
 """
 
+from functools import lru_cache
 from typing import Dict, Optional
 import streamlit as st
 
 from .themes import Theme, ThemeRegistry, DEFAULT_THEME
 
 
+# Session-state key holding the injection flags set by inject_css
+_INJECTED_KEYS_STATE = "_nt_injected_css_keys"
+
+
 def generate_base_css(theme: Theme) -> str:
     """Generate base CSS with theme variables.
     
@@ -612,16 +617,32 @@ def generate_all_css(theme: Optional[Theme] = None) -> str:
     if theme is None:
         theme = DEFAULT_THEME
     
-    css_parts = [
+    return _build_all_css(theme)
+
+
+@lru_cache(maxsize=8)
+def _build_all_css(theme: Theme) -> str:
+    """Build and memoize the combined CSS for a theme.
+    
+    Themes are frozen (hashable) dataclasses, so the multi-KB stylesheet
+    is assembled once per theme and reused on every Streamlit rerun.
+    Each fragment already carries its own <style> block, so the cached
+    string is injected as-is without another wrapping copy.
+    
+    Args:
+        theme: Theme configuration
+        
+    Returns:
+        Complete CSS string
+    """
+    return "\n".join((
         generate_base_css(theme),
         generate_terminal_effects_css(theme),
         generate_message_css(theme),
         generate_header_css(theme),
         generate_input_css(theme),
         generate_status_bar_css(theme),
-    ]
-    
-    return "\n".join(css_parts)
+    ))
 
 
 def inject_css(theme: Optional[Theme] = None, key: str = "nt_theme_css") -> None:
@@ -645,8 +666,9 @@ def inject_css(theme: Optional[Theme] = None, key: str = "nt_theme_css") -> None
     css = generate_all_css(theme)
     st.markdown(css, unsafe_allow_html=True)
     
-    # Mark as injected
+    # Mark as injected and track the flag for switch_theme
     st.session_state[css_key] = True
+    st.session_state.setdefault(_INJECTED_KEYS_STATE, set()).add(css_key)
 
 
 def switch_theme(theme_name: str) -> Theme:
@@ -660,10 +682,9 @@ def switch_theme(theme_name: str) -> Theme:
     """
     theme = ThemeRegistry.get_theme(theme_name)
     
-    # Clear injection flag to force re-injection
-    for key in list(st.session_state.keys()):
-        if key.endswith("_injected"):
-            del st.session_state[key]
+    # Clear tracked injection flags to force re-injection
+    for key in st.session_state.pop(_INJECTED_KEYS_STATE, ()):
+        st.session_state.pop(key, None)
     
     inject_css(theme)
     return theme
@@ -5,7 +5,8 @@ cyberpunk/terminal-inspired UI aesthetic.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from functools import cache
+from typing import Callable, Dict, Optional, Tuple
 from enum import Enum, auto
 
 
@@ -16,7 +17,7 @@ class ThemeMode(Enum):
     HIGH_CONTRAST = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorPalette:
     """Color palette for a theme.
     
@@ -49,7 +50,7 @@ class ColorPalette:
     glow: str             # Glow effect color
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Typography:
     """Typography configuration."""
     font_mono: str      # Monospace font stack
@@ -63,7 +64,7 @@ class Typography:
     line_height: float  # Base line height
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spacing:
     """Spacing scale."""
     xs: str = "0.25rem"   # 4px
@@ -74,7 +75,7 @@ class Spacing:
     xxl: str = "3rem"     # 48px
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Effects:
     """Visual effects configuration."""
     glow_intensity: str = "0 0 10px"
@@ -84,7 +85,7 @@ class Effects:
     cursor_blink: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Theme:
     """Complete theme configuration."""
     name: str
@@ -144,150 +145,189 @@ class Theme:
         }
 
 
+class _LazyTheme:
+    """Class attribute that builds its theme on first access.
+    
+    Keeps theme construction off the import path; only themes that are
+    actually used get built, and each is built once.
+    """
+    
+    def __init__(self, factory_name: str):
+        self._factory_name = factory_name
+    
+    def __get__(self, instance: object, owner: type) -> Theme:
+        return getattr(owner, self._factory_name)()
+
+
 class ThemeRegistry:
-    """Registry of available themes."""
+    """Registry of available themes.
+    
+    Themes are constructed lazily on first access and then cached.
+    """
     
     # Terminal Green Theme (Default)
-    TERMINAL_GREEN = Theme(
-        name="Terminal Green",
-        mode=ThemeMode.TERMINAL,
-        colors=ColorPalette(
-            # Backgrounds - Deep blacks
-            bg_primary="#0D1117",
-            bg_secondary="#161B22",
-            bg_tertiary="#21262D",
+    @staticmethod
+    @cache
+    def _terminal_green() -> Theme:
+        """Build the Terminal Green theme."""
+        return Theme(
+            name="Terminal Green",
+            mode=ThemeMode.TERMINAL,
+            colors=ColorPalette(
+                # Backgrounds - Deep blacks
+                bg_primary="#0D1117",
+                bg_secondary="#161B22",
+                bg_tertiary="#21262D",
             
-            # Text - High contrast whites/grays
-            text_primary="#E6EDF3",
-            text_secondary="#8B949E",
-            text_disabled="#484F58",
+                # Text - High contrast whites/grays
+                text_primary="#E6EDF3",
+                text_secondary="#8B949E",
+                text_disabled="#484F58",
             
-            # Accents - Terminal colors
-            accent_primary="#00FF41",    # Matrix green
-            accent_secondary="#FFB000",  # Amber
-            accent_error="#FF4136",      # Red
-            accent_warning="#FF851B",    # Orange
-            accent_info="#00D9FF",       # Cyan
+                # Accents - Terminal colors
+                accent_primary="#00FF41",    # Matrix green
+                accent_secondary="#FFB000",  # Amber
+                accent_error="#FF4136",      # Red
+                accent_warning="#FF851B",    # Orange
+                accent_info="#00D9FF",       # Cyan
             
-            # Borders
-            border_subtle="#30363D",
-            border_strong="#8B949E",
+                # Borders
+                border_subtle="#30363D",
+                border_strong="#8B949E",
             
-            # Special
-            cursor="#00FF41",
-            selection="rgba(0, 255, 65, 0.3)",
-            glow="rgba(0, 255, 65, 0.4)",
-        ),
-        typography=Typography(
-            font_mono='"JetBrains Mono", "Fira Code", "SF Mono", Monaco, "Cascadia Code", "Roboto Mono", Consolas, "Courier New", monospace',
-            font_sans='-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif',
-            font_size_xs="0.75rem",    # 12px
-            font_size_sm="0.875rem",   # 14px
-            font_size_base="1rem",     # 16px
-            font_size_md="1.125rem",   # 18px
-            font_size_lg="1.25rem",    # 20px
-            font_size_xl="1.5rem",     # 24px
-            line_height=1.6,
-        ),
-        effects=Effects(
-            glow_intensity="0 0 10px",
-            glow_spread="0 0 20px",
-            scanline_opacity=0.03,
-            crt_flicker=True,
-            cursor_blink=True,
-        ),
-    )
+                # Special
+                cursor="#00FF41",
+                selection="rgba(0, 255, 65, 0.3)",
+                glow="rgba(0, 255, 65, 0.4)",
+            ),
+            typography=Typography(
+                font_mono='"JetBrains Mono", "Fira Code", "SF Mono", Monaco, "Cascadia Code", "Roboto Mono", Consolas, "Courier New", monospace',
+                font_sans='-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif',
+                font_size_xs="0.75rem",    # 12px
+                font_size_sm="0.875rem",   # 14px
+                font_size_base="1rem",     # 16px
+                font_size_md="1.125rem",   # 18px
+                font_size_lg="1.25rem",    # 20px
+                font_size_xl="1.5rem",     # 24px
+                line_height=1.6,
+            ),
+            effects=Effects(
+                glow_intensity="0 0 10px",
+                glow_spread="0 0 20px",
+                scanline_opacity=0.03,
+                crt_flicker=True,
+                cursor_blink=True,
+            ),
+        )
     
     # Cyberpunk Amber Theme
-    CYBERPUNK_AMBER = Theme(
-        name="Cyberpunk Amber",
-        mode=ThemeMode.TERMINAL,
-        colors=ColorPalette(
-            bg_primary="#0A0A0A",
-            bg_secondary="#141414",
-            bg_tertiary="#1E1E1E",
+    @staticmethod
+    @cache
+    def _cyberpunk_amber() -> Theme:
+        """Build the Cyberpunk Amber theme."""
+        return Theme(
+            name="Cyberpunk Amber",
+            mode=ThemeMode.TERMINAL,
+            colors=ColorPalette(
+                bg_primary="#0A0A0A",
+                bg_secondary="#141414",
+                bg_tertiary="#1E1E1E",
             
-            text_primary="#FFE4B5",
-            text_secondary="#B8860B",
-            text_disabled="#5C4033",
+                text_primary="#FFE4B5",
+                text_secondary="#B8860B",
+                text_disabled="#5C4033",
             
-            accent_primary="#FFB000",    # Amber
-            accent_secondary="#FF6B00",  # Dark orange
-            accent_error="#FF2A2A",      # Bright red
-            accent_warning="#FFD700",    # Gold
-            accent_info="#00CED1",       # Dark turquoise
+                accent_primary="#FFB000",    # Amber
+                accent_secondary="#FF6B00",  # Dark orange
+                accent_error="#FF2A2A",      # Bright red
+                accent_warning="#FFD700",    # Gold
+                accent_info="#00CED1",       # Dark turquoise
             
-            border_subtle="#2A1F1F",
-            border_strong="#8B6914",
+                border_subtle="#2A1F1F",
+                border_strong="#8B6914",
             
-            cursor="#FFB000",
-            selection="rgba(255, 176, 0, 0.3)",
-            glow="rgba(255, 176, 0, 0.4)",
-        ),
-        typography=Typography(
-            font_mono='"VT323", "Share Tech Mono", "JetBrains Mono", "Fira Code", monospace',
-            font_sans='"Rajdhani", sans-serif',
-            font_size_xs="0.75rem",
-            font_size_sm="0.875rem",
-            font_size_base="1rem",
-            font_size_md="1.125rem",
-            font_size_lg="1.25rem",
-            font_size_xl="1.5rem",
-            line_height=1.5,
-        ),
-        effects=Effects(
-            glow_intensity="0 0 8px",
-            glow_spread="0 0 16px",
-            scanline_opacity=0.05,
-            crt_flicker=True,
-            cursor_blink=True,
-        ),
-    )
+                cursor="#FFB000",
+                selection="rgba(255, 176, 0, 0.3)",
+                glow="rgba(255, 176, 0, 0.4)",
+            ),
+            typography=Typography(
+                font_mono='"VT323", "Share Tech Mono", "JetBrains Mono", "Fira Code", monospace',
+                font_sans='"Rajdhani", sans-serif',
+                font_size_xs="0.75rem",
+                font_size_sm="0.875rem",
+                font_size_base="1rem",
+                font_size_md="1.125rem",
+                font_size_lg="1.25rem",
+                font_size_xl="1.5rem",
+                line_height=1.5,
+            ),
+            effects=Effects(
+                glow_intensity="0 0 8px",
+                glow_spread="0 0 16px",
+                scanline_opacity=0.05,
+                crt_flicker=True,
+                cursor_blink=True,
+            ),
+        )
     
     # Minimal Dark Theme
-    MINIMAL_DARK = Theme(
-        name="Minimal Dark",
-        mode=ThemeMode.DARK,
-        colors=ColorPalette(
-            bg_primary="#1E1E1E",
-            bg_secondary="#252526",
-            bg_tertiary="#2D2D30",
+    @staticmethod
+    @cache
+    def _minimal_dark() -> Theme:
+        """Build the Minimal Dark theme."""
+        return Theme(
+            name="Minimal Dark",
+            mode=ThemeMode.DARK,
+            colors=ColorPalette(
+                bg_primary="#1E1E1E",
+                bg_secondary="#252526",
+                bg_tertiary="#2D2D30",
             
-            text_primary="#D4D4D4",
-            text_secondary="#9CDCFE",
-            text_disabled="#6E6E6E",
+                text_primary="#D4D4D4",
+                text_secondary="#9CDCFE",
+                text_disabled="#6E6E6E",
             
-            accent_primary="#569CD6",    # Blue
-            accent_secondary="#4EC9B0",  # Teal
-            accent_error="#F44747",      # Red
-            accent_warning="#DCDCAA",    # Yellow
-            accent_info="#9CDCFE",       # Light blue
+                accent_primary="#569CD6",    # Blue
+                accent_secondary="#4EC9B0",  # Teal
+                accent_error="#F44747",      # Red
+                accent_warning="#DCDCAA",    # Yellow
+                accent_info="#9CDCFE",       # Light blue
             
-            border_subtle="#3E3E42",
-            border_strong="#555555",
+                border_subtle="#3E3E42",
+                border_strong="#555555",
             
-            cursor="#AEAFAD",
-            selection="rgba(0, 120, 215, 0.3)",
-            glow="rgba(86, 156, 214, 0.3)",
-        ),
-        typography=Typography(
-            font_mono='"SF Mono", "Consolas", "Courier New", monospace',
-            font_sans='"Segoe UI", sans-serif',
-            font_size_xs="0.75rem",
-            font_size_sm="0.875rem",
-            font_size_base="1rem",
-            font_size_md="1.125rem",
-            font_size_lg="1.25rem",
-            font_size_xl="1.5rem",
-            line_height=1.6,
-        ),
-        effects=Effects(
-            glow_intensity="0 0 5px",
-            glow_spread="0 0 10px",
-            scanline_opacity=0.0,
-            crt_flicker=False,
-            cursor_blink=False,
-        ),
+                cursor="#AEAFAD",
+                selection="rgba(0, 120, 215, 0.3)",
+                glow="rgba(86, 156, 214, 0.3)",
+            ),
+            typography=Typography(
+                font_mono='"SF Mono", "Consolas", "Courier New", monospace',
+                font_sans='"Segoe UI", sans-serif',
+                font_size_xs="0.75rem",
+                font_size_sm="0.875rem",
+                font_size_base="1rem",
+                font_size_md="1.125rem",
+                font_size_lg="1.25rem",
+                font_size_xl="1.5rem",
+                line_height=1.6,
+            ),
+            effects=Effects(
+                glow_intensity="0 0 5px",
+                glow_spread="0 0 10px",
+                scanline_opacity=0.0,
+                crt_flicker=False,
+                cursor_blink=False,
+            ),
+        )
+    
+    TERMINAL_GREEN = _LazyTheme("_terminal_green")
+    CYBERPUNK_AMBER = _LazyTheme("_cyberpunk_amber")
+    MINIMAL_DARK = _LazyTheme("_minimal_dark")
+    
+    _THEME_LIST: Tuple[Tuple[str, str], ...] = (
+        ("terminal", "Terminal Green (Default)"),
+        ("amber", "Cyberpunk Amber"),
+        ("minimal", "Minimal Dark"),
     )
     
     @classmethod
@@ -303,16 +343,16 @@ class ThemeRegistry:
         Raises:
             ValueError: If theme not found
         """
-        themes = {
-            "terminal": cls.TERMINAL_GREEN,
-            "terminal_green": cls.TERMINAL_GREEN,
-            "green": cls.TERMINAL_GREEN,
-            "amber": cls.CYBERPUNK_AMBER,
-            "cyberpunk": cls.CYBERPUNK_AMBER,
-            "cyberpunk_amber": cls.CYBERPUNK_AMBER,
-            "minimal": cls.MINIMAL_DARK,
-            "dark": cls.MINIMAL_DARK,
-            "minimal_dark": cls.MINIMAL_DARK,
+        themes: Dict[str, Callable[[], Theme]] = {
+            "terminal": cls._terminal_green,
+            "terminal_green": cls._terminal_green,
+            "green": cls._terminal_green,
+            "amber": cls._cyberpunk_amber,
+            "cyberpunk": cls._cyberpunk_amber,
+            "cyberpunk_amber": cls._cyberpunk_amber,
+            "minimal": cls._minimal_dark,
+            "dark": cls._minimal_dark,
+            "minimal_dark": cls._minimal_dark,
         }
         
         key = name.lower().replace(" ", "_")
@@ -320,20 +360,16 @@ class ThemeRegistry:
             available = ", ".join(sorted(set(themes.keys())))
             raise ValueError(f"Unknown theme '{name}'. Available: {available}")
         
-        return themes[key]
+        return themes[key]()
     
     @classmethod
-    def list_themes(cls) -> List[Tuple[str, str]]:
+    def list_themes(cls) -> Tuple[Tuple[str, str], ...]:
         """List available themes.
         
         Returns:
-            List of (key, display_name) tuples
+            Immutable, shared tuple of (key, display_name) pairs
         """
-        return [
-            ("terminal", "Terminal Green (Default)"),
-            ("amber", "Cyberpunk Amber"),
-            ("minimal", "Minimal Dark"),
-        ]
+        return cls._THEME_LIST
 
 
 # Default theme instance
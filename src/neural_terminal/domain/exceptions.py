@@ -4,7 +4,17 @@ Provides a comprehensive error hierarchy for the application.
 All exceptions inherit from NeuralTerminalError for consistent handling.
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+
+
+def _rebuild_error(
+    cls: type, args: Tuple[Any, ...], state: Dict[str, Any]
+) -> "NeuralTerminalError":
+    """Recreate a pickled or copied error without calling __init__."""
+    err = cls.__new__(cls, *args)
+    err.args = args
+    err.__dict__.update(state)
+    return err
 
 
 class NeuralTerminalError(Exception):
@@ -13,13 +23,26 @@ class NeuralTerminalError(Exception):
     Attributes:
         message: Human-readable error description
         code: Machine-readable error code (e.g., 'HTTP_429')
+
+    Subclasses with a fixed code declare it as the ``code`` class
+    attribute; an instance attribute is only set when a code is passed
+    explicitly.
     """
 
+    code: Optional[str] = None
+
     def __init__(self, message: str, code: Optional[str] = None):
         super().__init__(message)
-        self.code = code
+        if code is not None:
+            self.code = code
         self.message = message
 
+    def __reduce__(self):
+        # The default reduce re-calls __init__ with self.args, which fails
+        # for subclasses with extra required arguments; rebuild without
+        # __init__ and restore the instance attributes instead
+        return (_rebuild_error, (type(self), self.args, self.__dict__))
+
     def __str__(self) -> str:
         if self.code:
             return f"[{self.code}] {self.message}"
@@ -34,8 +57,6 @@ class NeuralTerminalError(Exception):
 class ConfigurationError(NeuralTerminalError):
     """Raised when there's an error in application configuration."""
 
-    pass
-
 
 # ============================================================================
 # Validation Errors
@@ -45,14 +66,14 @@ class ConfigurationError(NeuralTerminalError):
 class ValidationError(NeuralTerminalError):
     """Base class for validation errors."""
 
-    pass
-
 
 class InputTooLongError(ValidationError):
     """Raised when user input exceeds maximum length."""
 
+    code = "INPUT_TOO_LONG"
+
     def __init__(self, message: str, max_length: int, actual_length: int):
-        super().__init__(message, code="INPUT_TOO_LONG")
+        super().__init__(message)
         self.max_length = max_length
         self.actual_length = actual_length
 
@@ -60,8 +81,10 @@ class InputTooLongError(ValidationError):
 class EmptyInputError(ValidationError):
     """Raised when user input is empty or whitespace-only."""
 
+    code = "EMPTY_INPUT"
+
     def __init__(self, message: str = "Input cannot be empty"):
-        super().__init__(message, code="EMPTY_INPUT")
+        super().__init__(message)
 
 
 # ============================================================================
@@ -76,8 +99,10 @@ class CircuitBreakerOpenError(NeuralTerminalError):
     when the downstream service is failing.
     """
 
+    code = "CIRCUIT_OPEN"
+
     def __init__(self, message: str):
-        super().__init__(message, code="CIRCUIT_OPEN")
+        super().__init__(message)
 
 
 # ============================================================================
@@ -86,10 +111,16 @@ class CircuitBreakerOpenError(NeuralTerminalError):
 
 
 class APIError(NeuralTerminalError):
-    """Base class for API-related errors."""
+    """Base class for API-related errors.
+
+    The code defaults to ``HTTP_<status_code>`` unless the subclass
+    declares a fixed one.
+    """
 
     def __init__(self, message: str, status_code: int, code: Optional[str] = None):
-        super().__init__(message, code=code or f"HTTP_{status_code}")
+        if code is None and self.code is None:
+            code = f"HTTP_{status_code}"
+        super().__init__(message, code=code)
         self.status_code = status_code
 
 
@@ -133,6 +164,8 @@ class ModelUnavailableError(OpenRouterAPIError):
 class TokenLimitError(OpenRouterAPIError):
     """Raised when context exceeds model's token limit (400 error)."""
 
+    code = "TOKEN_LIMIT"
+
     def __init__(
         self,
         message: str = "Context too long",
@@ -140,7 +173,6 @@ class TokenLimitError(OpenRouterAPIError):
         actual_tokens: Optional[int] = None,
     ):
         super().__init__(message, status_code=400)
-        self.code = "TOKEN_LIMIT"  # Override the code after init
         self.max_tokens = max_tokens
         self.actual_tokens = actual_tokens
 
@@ -153,24 +185,20 @@ class TokenLimitError(OpenRouterAPIError):
 class ServiceError(NeuralTerminalError):
     """Base class for service-layer errors."""
 
-    pass
-
 
 class ConversationNotFoundError(ServiceError):
     """Raised when requested conversation doesn't exist."""
 
+    code = "CONVERSATION_NOT_FOUND"
+
     def __init__(self, conversation_id: str):
-        super().__init__(
-            f"Conversation {conversation_id} not found", code="CONVERSATION_NOT_FOUND"
-        )
+        super().__init__(f"Conversation {conversation_id} not found")
         self.conversation_id = conversation_id
 
 
 class MessageNotFoundError(ServiceError):
     """Raised when requested message doesn't exist."""
 
-    pass
-
 
 # ============================================================================
 # Budget Errors
@@ -180,19 +208,19 @@ class MessageNotFoundError(ServiceError):
 class BudgetError(NeuralTerminalError):
     """Base class for budget-related errors."""
 
-    pass
-
 
 class BudgetExceededError(BudgetError):
     """Raised when conversation cost exceeds budget limit."""
 
+    code = "BUDGET_EXCEEDED"
+
     def __init__(
         self,
         message: str = "Budget exceeded",
         accumulated: Optional[str] = None,
         limit: Optional[str] = None,
     ):
-        super().__init__(message, code="BUDGET_EXCEEDED")
+        super().__init__(message)
         self.accumulated = accumulated
         self.limit = limit
 
@@ -212,11 +240,32 @@ class RateLimitExceededError(NeuralTerminalError):
         retry_after: Seconds to wait before retrying
     """
 
+    code = "RATE_LIMIT_EXCEEDED"
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
-        code: str = "RATE_LIMIT_EXCEEDED",
+        code: Optional[str] = None,
         retry_after: Optional[float] = None,
     ):
         super().__init__(message, code=code)
         self.retry_after = retry_after
+
+
+# ============================================================================
+# Error Groups
+# ============================================================================
+
+# Built once so handlers can write ``except TRANSIENT_ERRORS:`` instead of
+# spelling the tuple out at each call site.
+
+# Errors that may succeed if the same request is retried later
+TRANSIENT_ERRORS = (
+    RateLimitError,
+    ModelUnavailableError,
+    RateLimitExceededError,
+    CircuitBreakerOpenError,
+)
+
+# Errors caused by user input or settings, safe to show as-is
+USER_FACING_ERRORS = (ValidationError, BudgetError)
@@ -31,7 +31,7 @@ class ConversationStatus(str, Enum):
     DELETED = "deleted"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenUsage:
     """Immutable token consumption metrics.
 
@@ -73,7 +73,7 @@ class TokenUsage:
         return prompt_cost + completion_cost
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Domain entity for chat messages.
 
@@ -102,7 +102,7 @@ class Message:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     """Aggregate root for conversations.
 
@@ -8,6 +8,7 @@ Phase 0 Defect C-4 Fix:
 - Add _check_state() method for manual circuit state verification
   (used by streaming to check circuit before starting)
 """
+import itertools
 import threading
 import time
 from enum import Enum, auto
@@ -48,6 +49,7 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self._failure_count = 0
+        self._fail_counter = itertools.count(1)
         self._last_failure_time: Optional[float] = None
         self._state = CircuitState.CLOSED
         self._lock = threading.Lock()  # Phase 0 Defect H-2 Fix
@@ -139,6 +141,7 @@ class CircuitBreaker:
             Uses lock for thread-safe state mutation.
         """
         with self._lock:
+            self._fail_counter = itertools.count(1)
             self._failure_count = 0
             self._state = CircuitState.CLOSED
     
@@ -149,7 +152,7 @@ class CircuitBreaker:
             Uses lock for thread-safe state mutation.
         """
         with self._lock:
-            self._failure_count += 1
+            self._failure_count = next(self._fail_counter)
             self._last_failure_time = time.time()
             if self._failure_count >= self.failure_threshold:
                 self._state = CircuitState.OPEN
@@ -162,6 +165,10 @@ class CircuitBreaker:
     
     @property
     def failure_count(self) -> int:
-        """Get current failure count."""
-        with self._lock:
-            return self._failure_count
+        """Get current failure count.
+        
+        Lock-free read: writers publish the count with a single attribute
+        rebind (produced by the C-level itertools.count), which is atomic
+        under the GIL, so readers never observe a torn value.
+        """
+        return self._failure_count
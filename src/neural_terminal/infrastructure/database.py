@@ -15,6 +15,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -116,6 +117,16 @@ class ConversationORM(Base):
         back_populates="conversation",
         cascade="all, delete-orphan"
     )
+    
+    # Partial index serving list_active(): only non-deleted rows, already in
+    # updated_at DESC order, so the query walks it instead of scan + sort
+    __table_args__ = (
+        Index(
+            "idx_conversations_active_updated",
+            updated_at.desc(),
+            sqlite_where=status != ConversationStatus.DELETED,
+        ),
+    )
 
 
 class MessageORM(Base):
@@ -144,8 +155,20 @@ class MessageORM(Base):
     conversation = relationship("ConversationORM", back_populates="messages")
 
 
+def _create_schema(bind) -> None:
+    """Create missing tables, then any indexes missing on existing tables.
+    
+    create_all() only emits an index together with its table, so indexes
+    added to a model later are created here for databases that predate them.
+    """
+    Base.metadata.create_all(bind=bind)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
+
+
 # Create all tables
-Base.metadata.create_all(bind=engine)
+_create_schema(engine)
 
 
 def init_db() -> None:
@@ -154,7 +177,7 @@ def init_db() -> None:
     Creates all tables if they don't exist.
     Safe to call multiple times.
     """
-    Base.metadata.create_all(bind=engine)
+    _create_schema(engine)
 
 
 def get_db_session() -> Session:
@@ -9,12 +9,24 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Optional
 from neural_terminal.domain.exceptions import ValidationError
+# C0 control characters except tab and newline, mapped to None for str.translate
+_CONTROL_CHAR_TABLE = dict.fromkeys(c for c in range(32) if c not in (9, 10))
+_SPACE_RUN_RE = re.compile(r' {2,}')
+# ASCII characters never combine with what precedes them under NFC, so input
+# can be cut just before one without changing the normalized prefix. Only
+# characters that survive control stripping qualify: a stripped one would
+# let the characters around it compose across the cut.
+_ASCII_RE = re.compile(r'[\t\n\x20-\x7e]')
+# Anything sanitize() would change, other than edge whitespace, length and
+# normalization; the second form adds the characters html.escape rewrites
+_NEEDS_WORK_RE = re.compile(r'[\x00-\x08\x0b-\x1f]| {2}')
+_NEEDS_WORK_HTML_RE = re.compile(r'[\x00-\x08\x0b-\x1f&<>"\']| {2}')
 class SanitizationLevel(Enum):
     """Sanitization strictness levels."""
     PERMISSIVE = auto()  # Allow most content
     NORMAL = auto()      # Default sanitization
     STRICT = auto()      # Maximum sanitization
-@dataclass
+@dataclass(slots=True)
 class SanitizedResult:
     """Result of sanitization with metadata.
     
@@ -70,6 +82,15 @@ class InputSanitizer:
         r"vbscript\s*:",
     ]
     
+    # Each pattern list folded into one alternation, so detection is a
+    # single regex scan per category instead of one scan per pattern
+    _SQL_INJECTION_RE = re.compile(
+        "|".join(map("(?:{})".format, SQL_INJECTION_PATTERNS)), re.IGNORECASE
+    )
+    _XSS_RE = re.compile(
+        "|".join(map("(?:{})".format, XSS_PATTERNS)), re.IGNORECASE
+    )
+    
     def __init__(
         self,
         max_length: int = DEFAULT_MAX_LENGTH,
@@ -83,8 +104,11 @@ class InputSanitizer:
         """
         self.max_length = max_length
         self.level = level
-        self._sql_patterns = [re.compile(p, re.IGNORECASE) for p in self.SQL_INJECTION_PATTERNS]
-        self._xss_patterns = [re.compile(p, re.IGNORECASE) for p in self.XSS_PATTERNS]
+        self._needs_work_re = (
+            _NEEDS_WORK_RE
+            if level == SanitizationLevel.PERMISSIVE
+            else _NEEDS_WORK_HTML_RE
+        )
     
     def sanitize(self, content: Optional[str]) -> str:
         """Sanitize input string.
@@ -104,10 +128,40 @@ class InputSanitizer:
         if not isinstance(content, str):
             content = str(content)
         
-        # Remove null bytes
-        content = content.replace('\x00', '')
+        # Fast path: input that is already clean comes back as-is, skipping
+        # the copies made by each step below
+        if self._is_clean(content):
+            return content
+        
+        # Oversized input: run the pipeline over a prefix with 2x slack for
+        # characters that get removed, cut at an NFC-safe boundary. The
+        # result is a prefix of the full output, so it is exact whenever it
+        # already fills max_length.
+        if len(content) > self.max_length * 2:
+            cut = _ASCII_RE.search(content, self.max_length * 2)
+            if cut is not None:
+                head = self._clean(content[:cut.start()])
+                if len(head) >= self.max_length:
+                    return head[:self.max_length]
+        
+        content = self._clean(content)
+        
+        # Truncate to max length
+        if len(content) > self.max_length:
+            content = content[:self.max_length]
+        
+        return content
+    
+    def _clean(self, content: str) -> str:
+        """Run the sanitization pipeline without truncating.
         
-        # Strip control characters except newline and tab
+        Args:
+            content: Input string
+            
+        Returns:
+            Sanitized string of any length
+        """
+        # Strip null bytes and control characters except newline and tab
         content = self._strip_control_chars(content)
         
         # Normalize unicode to NFC
@@ -117,7 +171,7 @@ class InputSanitizer:
         content = content.strip()
         
         # Collapse multiple spaces into single space
-        content = re.sub(r' +', ' ', content)
+        content = _SPACE_RUN_RE.sub(' ', content)
         
         # Handle HTML based on strictness level
         if self.level == SanitizationLevel.STRICT:
@@ -126,10 +180,6 @@ class InputSanitizer:
             content = html.escape(content)
         # PERMISSIVE: Don't escape HTML
         
-        # Truncate to max length
-        if len(content) > self.max_length:
-            content = content[:self.max_length]
-        
         return content
     
     def sanitize_with_metadata(self, content: Optional[str]) -> SanitizedResult:
@@ -152,18 +202,14 @@ class InputSanitizer:
         has_suspicious = False
         
         # Check for SQL injection patterns
-        for pattern in self._sql_patterns:
-            if pattern.search(content):
-                warnings.append("sql_injection")
-                has_suspicious = True
-                break
+        if self._SQL_INJECTION_RE.search(content):
+            warnings.append("sql_injection")
+            has_suspicious = True
         
         # Check for XSS patterns
-        for pattern in self._xss_patterns:
-            if pattern.search(content):
-                warnings.append("xss_attempt")
-                has_suspicious = True
-                break
+        if self._XSS_RE.search(content):
+            warnings.append("xss_attempt")
+            has_suspicious = True
         
         return SanitizedResult(
             content=sanitized,
@@ -174,6 +220,22 @@ class InputSanitizer:
             warnings=warnings
         )
     
+    def _is_clean(self, content: str) -> bool:
+        """Check whether sanitize() would return content unchanged.
+        
+        Args:
+            content: Input string
+            
+        Returns:
+            True if no sanitization step would modify content
+        """
+        return (
+            len(content) <= self.max_length
+            and content == content.strip()
+            and self._needs_work_re.search(content) is None
+            and unicodedata.is_normalized('NFC', content)
+        )
+    
     def _strip_control_chars(self, content: str) -> str:
         """Remove control characters except newline and tab.
         
@@ -183,13 +245,4 @@ class InputSanitizer:
         Returns:
             String with control characters removed
         """
-        result = []
-        for char in content:
-            # Keep printable chars, newline, and tab
-            if char == '\n' or char == '\t':
-                result.append(char)
-            elif ord(char) >= 32:
-                # Printable ASCII or higher
-                result.append(char)
-            # Skip other control characters (0x01-0x1F except 0x09, 0x0A)
-        return ''.join(result)
+        return content.translate(_CONTROL_CHAR_TABLE)
@@ -1,27 +1,38 @@
 """Logger factory for Neural Terminal.
 
 Provides pre-configured structlog loggers with common context.
+
+Pass variable data as keyword arguments (``logger.debug("req", size=n)``)
+or %-style positional arguments, never as a pre-built f-string: events
+below the configured level are dropped before formatting, so only the
+f-string form would pay for formatting a message nobody sees.
 """
 
+from functools import lru_cache
+
 import structlog
+from structlog.typing import FilteringBoundLogger
 from typing import Any, Optional
 
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+@lru_cache(maxsize=None)
+def get_logger(name: str) -> FilteringBoundLogger:
     """Get a pre-configured logger instance.
 
+    Memoized per name, like ``logging.getLogger``: repeated calls return
+    the same logger.
+
     Args:
         name: Logger name (typically __name__ from calling module)
 
     Returns:
-        Configured structlog BoundLogger with common context
+        Configured structlog FilteringBoundLogger with common context
 
     Example:
         >>> logger = get_logger(__name__)
         >>> logger.info("User logged in", user_id=123)
     """
-    logger = structlog.get_logger(name)
-    return logger
+    return structlog.get_logger(name)
 
 
 class LoggerMixin:
@@ -38,10 +49,10 @@ class LoggerMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize logger mixin."""
         super().__init__(*args, **kwargs)
-        self._logger: Optional[structlog.stdlib.BoundLogger] = None
+        self._logger: Optional[FilteringBoundLogger] = None
 
     @property
-    def logger(self) -> structlog.stdlib.BoundLogger:
+    def logger(self) -> FilteringBoundLogger:
         """Get logger instance (lazy initialization)."""
         if self._logger is None:
             # Get the module name from the class
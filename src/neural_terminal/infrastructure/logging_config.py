@@ -4,13 +4,69 @@ Provides structured logging with structlog, supporting both console
 and JSON output formats. Automatically redacts sensitive data.
 """
 
+import atexit
 import logging
+import queue
+import re
 import sys
-from typing import Any, Dict, List
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional, Tuple
 
 import structlog
 from structlog.stdlib import filter_by_level
 
+try:  # Optional: faster JSON log rendering
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+try:  # Optional: linear-time matching for redaction (google-re2)
+    import re2 as _redact_engine
+except ImportError:  # pragma: no cover - exercised only with re2 installed
+    _redact_engine = re
+
+
+# (group name, pattern, replacement) for each kind of sensitive value.
+# Patterns must stay within the RE2 subset (no lookaround, no
+# backreferences) so they compile under either engine.
+_REDACTIONS = (
+    ("nvapi_key", r"nvapi-[a-zA-Z0-9_-]+", "***API_KEY***"),
+    ("sk_key", r"sk-[a-zA-Z0-9_-]+", "***API_KEY***"),
+    (
+        "bearer",
+        r"Bearer\s+[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+",
+        "Bearer ***TOKEN***",
+    ),
+    (
+        "password",
+        r'password["\']?\s*[:=]\s*["\']?[^"\'\s]+',
+        "password=***REDACTED***",
+    ),
+    (
+        "api_key",
+        r'api_key["\']?\s*[:=]\s*["\']?[^"\'\s]+',
+        "api_key=***REDACTED***",
+    ),
+)
+
+# All patterns folded into one alternation so each string is scanned once;
+# the named group that matched selects the replacement
+_REDACT_RE = _redact_engine.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in _REDACTIONS)
+)
+_REPLACEMENTS = {name: replacement for name, _, replacement in _REDACTIONS}
+
+# Literal text every redaction pattern must contain; strings holding none of
+# these are skipped without running the regex. Keep in step with _REDACTIONS.
+_REDACT_TRIGGERS = ("nvapi-", "sk-", "Bearer", "password", "api_key")
+
+
+def _redact_match(match: "re.Match[str]") -> str:
+    """Return the replacement for whichever redaction pattern matched."""
+    return _REPLACEMENTS[match.lastgroup]
+
 
 def redact_sensitive_data(
     logger: Any, method_name: str, event_dict: Dict[str, Any]
@@ -23,44 +79,99 @@ def redact_sensitive_data(
     - Passwords
     - Private keys
     """
-    import re
-
-    # Patterns to redact
-    patterns = [
-        (r"nvapi-[a-zA-Z0-9_-]+", "***API_KEY***"),
-        (r"sk-[a-zA-Z0-9_-]+", "***API_KEY***"),
-        (
-            r"Bearer\s+[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+\.[a-zA-Z0-9_-]+",
-            "Bearer ***TOKEN***",
-        ),
-        (r'password["\']?\s*[:=]\s*["\']?[^"\'\s]+', "password=***REDACTED***"),
-        (r'api_key["\']?\s*[:=]\s*["\']?[^"\'\s]+', "api_key=***REDACTED***"),
-    ]
-
-    # Check event message
-    if "event" in event_dict and isinstance(event_dict["event"], str):
-        for pattern, replacement in patterns:
-            event_dict["event"] = re.sub(pattern, replacement, event_dict["event"])
-
-    # Check other string fields
     for key, value in event_dict.items():
-        if isinstance(value, str) and key != "event":
-            for pattern, replacement in patterns:
-                event_dict[key] = re.sub(pattern, replacement, value)
+        if isinstance(value, str):
+            for trigger in _REDACT_TRIGGERS:
+                if trigger in value:
+                    event_dict[key] = _REDACT_RE.sub(_redact_match, value)
+                    break
 
     return event_dict
 
 
+def _orjson_serializer(obj: Any, **kwargs: Any) -> str:
+    """JSONRenderer serializer backed by orjson.
+
+    Honors the renderer's ``default`` fallback and accepts non-string keys
+    like json.dumps does; returns str since stdlib handlers expect text.
+    """
+    return orjson.dumps(
+        obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode("utf-8")
+
+
+# (UTC epoch second, "YYYY-MM-DDTHH:MM:SS") for the last timestamp written;
+# replaced as a whole so concurrent readers never see a mixed pair
+_timestamp_second: Tuple[int, str] = (-1, "")
+
+
 def add_timestamp(
     logger: Any, method_name: str, event_dict: Dict[str, Any]
 ) -> Dict[str, Any]:
-    """Add ISO format timestamp to log events."""
-    from datetime import datetime
+    """Add ISO format UTC timestamp to log events.
 
-    event_dict["timestamp"] = datetime.utcnow().isoformat() + "Z"
+    The date/time part is formatted once per second and reused; only the
+    microseconds are formatted per event.
+    """
+    global _timestamp_second
+
+    ns = time.time_ns()
+    second, micros = divmod(ns // 1000, 1_000_000)
+    cached_second, prefix = _timestamp_second
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        )
+        _timestamp_second = (second, prefix)
+
+    event_dict["timestamp"] = f"{prefix}.{micros:06d}Z"
     return event_dict
 
 
+# Background sink installed by configure_logging(); None until then
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def _install_queue_sink() -> None:
+    """Route root-logger output through a queue drained by a thread.
+
+    Mirrors logging.basicConfig: does nothing if the root logger already
+    has handlers (or the sink is installed). Callers then only pay for an
+    enqueue; the listener thread does the stderr writes.
+    """
+    global _queue_handler, _listener
+
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _queue_handler = QueueHandler(log_queue)
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    root.addHandler(_queue_handler)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background log sink, if installed.
+
+    Registered with atexit; safe to call more than once.
+    """
+    global _queue_handler, _listener
+
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()  # Drains records still in the queue
+    _queue_handler = None
+    _listener = None
+
+
 def configure_logging(log_level: str = "INFO", json_format: bool = False) -> None:
     """Configure structlog for the application.
 
@@ -77,20 +188,20 @@ def configure_logging(log_level: str = "INFO", json_format: bool = False) -> Non
     }
     level = level_map.get(log_level.upper(), logging.INFO)
 
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stderr,
-        level=level,
-    )
+    # Configure standard library logging: stderr, written off-thread
+    _install_queue_sink()
 
     # Build processor chain
+    # filter_by_level comes first so events below the configured level are
+    # dropped before any other processor (or %-formatting of positional
+    # args) runs
     shared_processors: List[Any] = [
+        filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
+        add_timestamp,
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         redact_sensitive_data,
@@ -98,7 +209,12 @@ def configure_logging(log_level: str = "INFO", json_format: bool = False) -> Non
 
     if json_format:
         # JSON format for production
-        processors = shared_processors + [structlog.processors.JSONRenderer()]
+        renderer = (
+            structlog.processors.JSONRenderer(serializer=_orjson_serializer)
+            if orjson is not None
+            else structlog.processors.JSONRenderer()
+        )
+        processors = shared_processors + [renderer]
     else:
         # Pretty console format for development
         processors = shared_processors + [structlog.dev.ConsoleRenderer(colors=True)]
@@ -108,7 +224,9 @@ def configure_logging(log_level: str = "INFO", json_format: bool = False) -> Non
         processors=processors,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Methods below the level are bound to a no-op, so filtered calls
+        # return before any processor runs or event dict is built
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
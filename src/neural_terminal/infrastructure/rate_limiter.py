@@ -6,7 +6,7 @@ Provides client-side rate limiting to protect against excessive API usage.
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Callable, Optional
 
 from neural_terminal.domain.exceptions import RateLimitExceededError
 
@@ -46,27 +46,36 @@ class RateLimiter:
             pass
     """
 
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        time_fn: Callable[[], float] = time.monotonic,
+    ):
         """Initialize rate limiter.
 
         Args:
             config: Rate limit configuration (uses defaults if None)
+            time_fn: Monotonic clock in seconds; tests can pass a fake one
         """
         self._config = config or RateLimitConfig()
+        self._time_fn = time_fn
         self._tokens = self._config.burst_size
-        self._last_update = time.monotonic()
+        self._last_update = time_fn()
         self._lock = threading.Lock()
+        # Refill rate and its inverse, fixed for the limiter's lifetime
+        self._tokens_per_second = self._config.requests_per_minute / 60.0
+        self._seconds_per_token = 60.0 / self._config.requests_per_minute
 
     def _replenish_tokens(self) -> None:
         """Replenish tokens based on time elapsed.
 
         Called internally to update token count before checking.
         """
-        now = time.monotonic()
+        now = self._time_fn()
         elapsed = now - self._last_update
 
         # Calculate tokens to add: (requests_per_minute / 60) * elapsed
-        tokens_to_add = (self._config.requests_per_minute / 60.0) * elapsed
+        tokens_to_add = self._tokens_per_second * elapsed
 
         self._tokens = min(self._config.burst_size, self._tokens + tokens_to_add)
         self._last_update = now
@@ -127,10 +136,8 @@ class RateLimiter:
         if self._tokens >= 1:
             return 0.0
 
-        # Time to generate one token
-        seconds_per_token = 60.0 / self._config.requests_per_minute
         tokens_needed = 1 - self._tokens
-        return tokens_needed * seconds_per_token
+        return tokens_needed * self._seconds_per_token
 
     def get_wait_time(self) -> float:
         """Calculate seconds to wait for next token.
@@ -149,4 +156,4 @@ class RateLimiter:
         """
         with self._lock:
             self._tokens = self._config.burst_size
-            self._last_update = time.monotonic()
+            self._last_update = self._time_fn()
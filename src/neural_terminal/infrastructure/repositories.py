@@ -7,14 +7,16 @@ Phase 0 Defect C-3 Fix:
 - Use SessionLocal.remove() for cleanup
 """
 
+import sqlite3
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from decimal import Decimal
-from typing import Generator, List, Optional
+from typing import Generator, Iterable, Iterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, update
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine, insert, select, update
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from neural_terminal.domain.models import (
     Conversation,
@@ -29,6 +31,9 @@ from neural_terminal.infrastructure.database import (
     SessionLocal,
 )
 
+# Built once; SQLAlchemy's compiled cache then reuses its SQL on every call
+_INSERT_MESSAGES = insert(MessageORM)
+
 
 class ConversationRepository(ABC):
     """Abstract base class for conversation repositories."""
@@ -48,6 +53,16 @@ class ConversationRepository(ABC):
         """
         raise NotImplementedError
 
+    def iter_messages(
+        self, conversation_id: UUID, batch_size: int = 1000
+    ) -> Iterator[Message]:
+        """Iterate a conversation's messages, oldest first.
+
+        Implementations may fetch lazily in batches; the default simply
+        iterates get_messages().
+        """
+        yield from self.get_messages(conversation_id)
+
     @abstractmethod
     def save(self, conversation: Conversation) -> None:
         """Save or update a conversation."""
@@ -58,6 +73,15 @@ class ConversationRepository(ABC):
         """Add a message to a conversation."""
         raise NotImplementedError
 
+    def add_messages(self, messages: Iterable[Message]) -> None:
+        """Add several messages at once.
+
+        Implementations may write them in a single transaction; the default
+        simply calls add_message() for each.
+        """
+        for message in messages:
+            self.add_message(message)
+
     @abstractmethod
     def list_active(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
         """List active conversations ordered by updated_at descending."""
@@ -70,8 +94,39 @@ class SQLiteConversationRepository(ConversationRepository):
     Phase 0 Defect C-3 Fix:
         Uses _session_scope() context manager for proper session lifecycle.
         SessionLocal.remove() is called in finally block to prevent leaks.
+
+    Args:
+        session_factory: Scoped session factory to use. Defaults to the
+            application-wide SessionLocal bound to settings.database_url.
     """
 
+    def __init__(self, session_factory: Optional[scoped_session] = None):
+        self._session_factory = session_factory or SessionLocal
+
+    @classmethod
+    def from_connection(
+        cls, connection: sqlite3.Connection
+    ) -> "SQLiteConversationRepository":
+        """Create a repository over an already-open SQLite connection.
+
+        Every session reuses the given connection, which must already
+        contain the schema. Intended for in-memory databases, e.g. ones
+        cloned from a template with ``sqlite3.Connection.backup``.
+
+        Args:
+            connection: Open DBAPI connection (check_same_thread=False if
+                it will be used from other threads)
+
+        Returns:
+            Repository bound to the connection
+        """
+        # Foreign key enforcement is per connection and not copied by backup
+        connection.execute("PRAGMA foreign_keys=ON")
+        engine = create_engine(
+            "sqlite://", creator=lambda: connection, poolclass=StaticPool
+        )
+        return cls(scoped_session(sessionmaker(autoflush=False, bind=engine)))
+
     @contextmanager
     def _session_scope(self) -> Generator[Session, None, None]:
         """Provide a transactional scope around a series of operations.
@@ -88,7 +143,7 @@ class SQLiteConversationRepository(ConversationRepository):
             This replaces the broken _get_session()/_close_session() pattern
             that leaked sessions by creating orphaned context managers.
         """
-        session = SessionLocal()
+        session = self._session_factory()
         try:
             yield session
             session.commit()
@@ -96,7 +151,7 @@ class SQLiteConversationRepository(ConversationRepository):
             session.rollback()
             raise
         finally:
-            SessionLocal.remove()  # Critical for scoped_session cleanup
+            self._session_factory.remove()  # Critical for scoped_session cleanup
 
     def _to_domain(self, orm: ConversationORM) -> Conversation:
         """Convert Conversation ORM to domain model."""
@@ -174,6 +229,38 @@ class SQLiteConversationRepository(ConversationRepository):
             )
             return [self._message_to_domain(r) for r in results]
 
+    def iter_messages(
+        self, conversation_id: UUID, batch_size: int = 1000
+    ) -> Iterator[Message]:
+        """Stream a conversation's messages, ordered by creation time.
+
+        Runs a single query and pulls rows in batches of ``batch_size``,
+        so long conversations are never fully materialized. The query uses
+        its own session rather than the thread's scoped one, so other
+        repository calls made mid-iteration cannot remove it under the open
+        cursor. That session is closed when the iterator is exhausted,
+        closed, or garbage-collected.
+
+        Args:
+            conversation_id: The conversation UUID
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Messages ordered by created_at ascending (oldest first)
+        """
+        session = self._session_factory.session_factory()
+        try:
+            results = session.scalars(
+                select(MessageORM)
+                .where(MessageORM.conversation_id == conversation_id)
+                .order_by(MessageORM.created_at.asc())
+                .execution_options(yield_per=batch_size)
+            )
+            for orm in results:
+                yield self._message_to_domain(orm)
+        finally:
+            session.close()
+
     def save(self, conversation: Conversation) -> None:
         """Save or update a conversation."""
         with self._session_scope() as session:
@@ -193,30 +280,46 @@ class SQLiteConversationRepository(ConversationRepository):
 
     def add_message(self, message: Message) -> None:
         """Add a message to a conversation."""
+        self.add_messages([message])
+
+    def add_messages(self, messages: Iterable[Message]) -> None:
+        """Add messages in one transaction with a single executemany INSERT.
+
+        Args:
+            messages: Messages to insert; each must have a conversation_id
+
+        Raises:
+            ValueError: If any message has no conversation_id (nothing is
+                written in that case)
+        """
+        rows = [self._message_to_row(message) for message in messages]
+        if not rows:
+            return
+
+        with self._session_scope() as session:
+            session.execute(_INSERT_MESSAGES, rows)
+
+    @staticmethod
+    def _message_to_row(message: Message) -> dict:
+        """Convert a domain message to MessageORM insert values."""
         if message.conversation_id is None:
             raise ValueError("Message must belong to a conversation")
 
-        with self._session_scope() as session:
-            orm = MessageORM(
-                id=message.id,
-                conversation_id=message.conversation_id,
-                role=message.role,
-                content=message.content,
-                prompt_tokens=message.token_usage.prompt_tokens
-                if message.token_usage
-                else None,
-                completion_tokens=message.token_usage.completion_tokens
-                if message.token_usage
-                else None,
-                total_tokens=message.token_usage.total_tokens
-                if message.token_usage
-                else None,
-                cost=message.cost,
-                latency_ms=message.latency_ms,
-                model_id=message.model_id,
-                metadata=message.metadata,
-            )
-            session.add(orm)
+        usage = message.token_usage
+        return {
+            "id": message.id,
+            "conversation_id": message.conversation_id,
+            "role": message.role,
+            "content": message.content,
+            "prompt_tokens": usage.prompt_tokens if usage else None,
+            "completion_tokens": usage.completion_tokens if usage else None,
+            "total_tokens": usage.total_tokens if usage else None,
+            "cost": message.cost,
+            "latency_ms": message.latency_ms,
+            "model_id": message.model_id,
+            "created_at": message.created_at,
+            "meta": message.metadata,
+        }
 
     def list_active(self, limit: int = 50, offset: int = 0) -> List[Conversation]:
         """List active conversations ordered by updated_at descending.
@@ -227,11 +330,9 @@ class SQLiteConversationRepository(ConversationRepository):
             results = (
                 session.execute(
                     select(ConversationORM)
-                    .where(
-                        (ConversationORM.status == ConversationStatus.ACTIVE)
-                        | (ConversationORM.status == ConversationStatus.ARCHIVED)
-                        | (ConversationORM.status == ConversationStatus.FORKED)
-                    )
+                    # Same predicate as idx_conversations_active_updated,
+                    # so SQLite can use the partial index
+                    .where(ConversationORM.status != ConversationStatus.DELETED)
                     .order_by(ConversationORM.updated_at.desc())
                     .limit(limit)
                     .offset(offset)
@@ -2,34 +2,158 @@
 
 Provides model-aware token counting with encoding caching.
 """
+import os
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
 import tiktoken
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from neural_terminal.domain.models import Message, MessageRole
 
 
+# Mapping of model name patterns to tiktoken encoding names
+ENCODING_MAP = {
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-3.5-turbo": "cl100k_base",
+    "claude": "cl100k_base",  # Approximation - Claude uses different tokenizer
+    "default": "cl100k_base"
+}
+
+
+@lru_cache(maxsize=64)
+def _normalize_model(model_id: str) -> str:
+    """Strip the provider prefix and lowercase a model identifier.
+    
+    'openai/gpt-4' and 'gpt-4' normalize to the same key so they share
+    one encoder cache slot. Cached so each call returns the same string
+    object, whose hash is computed once for the count cache lookups.
+    """
+    return model_id.split("/")[-1].lower()
+
+
+@lru_cache(maxsize=32)
+def _resolve_encoder(model: str) -> tiktoken.Encoding:
+    """Resolve the encoder for a normalized model name.
+    
+    Cached process-wide so every TokenCounter shares one BPE table.
+    
+    Args:
+        model: Normalized model name (see _normalize_model)
+        
+    Returns:
+        Tiktoken encoding instance
+    """
+    # Find matching encoding key in model name
+    encoding_key = "default"
+    for key in ENCODING_MAP:
+        if key in model and key != "default":
+            encoding_key = key
+            break
+    
+    return tiktoken.get_encoding(ENCODING_MAP[encoding_key])
+
+
+# The count cache holds its keys, i.e. full message texts, for the life of
+# the process and across every Streamlit session. Both the entry count and
+# the length of a cacheable text are capped, so retention stays within
+# roughly _COUNT_CACHE_SIZE * _MAX_CACHED_CHARS characters; longer texts
+# are encoded on every call.
+_COUNT_CACHE_SIZE = 256
+_MAX_CACHED_CHARS = 8192
+
+
+def _encode_len(model: str, text: str) -> int:
+    """Encode text and return its token count."""
+    return len(_resolve_encoder(model).encode_ordinary(text))
+
+
+_count_str_cached = lru_cache(maxsize=_COUNT_CACHE_SIZE)(_encode_len)
+
+
+def _count_str(model: str, text: str) -> int:
+    """Count tokens in text, memoized per (model, text) pair.
+    
+    History is re-counted on every turn and truncation pass, so the same
+    strings come through repeatedly. Uses encode_ordinary: content is
+    arbitrary user text, so special-token markers count as plain text
+    instead of raising.
+    
+    Args:
+        model: Normalized model name (see _normalize_model)
+        text: Text to count
+        
+    Returns:
+        Number of tokens
+    """
+    if len(text) > _MAX_CACHED_CHARS:
+        return _encode_len(model, text)
+    return _count_str_cached(model, text)
+
+
+@lru_cache(maxsize=32)
+def _role_tokens(model: str) -> Dict[MessageRole, int]:
+    """Token cost of each role name, built once per normalized model.
+    
+    Built lazily rather than at import so loading the module never
+    triggers a BPE download.
+    """
+    encoder = _resolve_encoder(model)
+    return {role: len(encoder.encode_ordinary(role.value)) for role in MessageRole}
+
+
+def _message_tokens(model: str, message: Message) -> int:
+    """Count tokens in a message for an already-normalized model name."""
+    # Tiktoken format: <|start|>{role}\n{content}<|end|>
+    # Every message follows <|start|>{role/name}\n{content}<|end|>
+    # See: https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb
+    tokens = 4  # Base overhead for message formatting
+    tokens += _role_tokens(model)[message.role]
+    tokens += _count_str(model, message.content)
+    return tokens
+
+
+def prewarm_encoders() -> List[str]:
+    """Load the BPE tables used by ENCODING_MAP into the encoder cache.
+    
+    The first get_encoding call reads (or downloads) the BPE file, so
+    doing it up front moves that cost out of the first request.
+    
+    Returns:
+        Model keys whose encoders loaded; failures are skipped
+    """
+    warmed = []
+    for key in ENCODING_MAP:
+        try:
+            _resolve_encoder(key)
+        except Exception:
+            continue
+        warmed.append(key)
+    return warmed
+
+
+# Opt-in: loading at import blocks on the BPE download when the cache is cold
+_PREWARMED: List[str] = (
+    prewarm_encoders() if os.environ.get("NEXX_PREWARM_TIKTOKEN") == "1" else []
+)
+
+
 class TokenCounter:
     """Model-aware token counting with encoding caching.
     
     Uses tiktoken for accurate OpenAI-compatible token counting.
     Falls back to cl100k_base for unknown models (Claude approximation).
+    Stateless: all caches are process-wide, so instances are free to
+    create and share.
     """
     
-    # Mapping of model name patterns to tiktoken encoding names
-    ENCODING_MAP = {
-        "gpt-4": "cl100k_base",
-        "gpt-4-turbo": "cl100k_base",
-        "gpt-3.5-turbo": "cl100k_base",
-        "claude": "cl100k_base",  # Approximation - Claude uses different tokenizer
-        "default": "cl100k_base"
-    }
-    
-    def __init__(self):
-        """Initialize with empty encoder cache."""
-        self._encoders: dict = {}
+    ENCODING_MAP = ENCODING_MAP
     
-    def _get_encoder(self, model_id: str) -> tiktoken.Encoding:
-        """Get or create encoder for model.
+    @staticmethod
+    def _get_encoder(model_id: str) -> tiktoken.Encoding:
+        """Get encoder for model from the process-wide cache.
         
         Args:
             model_id: Model identifier (e.g., 'openai/gpt-3.5-turbo')
@@ -37,26 +161,18 @@ class TokenCounter:
         Returns:
             Tiktoken encoding instance
         """
-        # Extract base model name
-        base = model_id.split("/")[-1].lower()
-        
-        # Find matching encoding key in model name
-        encoding_key = "default"
-        for key in self.ENCODING_MAP:
-            if key in base and key != "default":
-                encoding_key = key
-                break
-        
-        # Get actual encoding name from map
-        encoding_name = self.ENCODING_MAP[encoding_key]
-        
-        # Cache encoder instances
-        if encoding_name not in self._encoders:
-            self._encoders[encoding_name] = tiktoken.get_encoding(encoding_name)
-        
-        return self._encoders[encoding_name]
+        return _resolve_encoder(_normalize_model(model_id))
     
-    def count_tokens(self, text: str, model_id: str) -> int:
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear the process-wide encoder and token count caches."""
+        _normalize_model.cache_clear()
+        _role_tokens.cache_clear()
+        _count_str_cached.cache_clear()
+        _resolve_encoder.cache_clear()
+    
+    @staticmethod
+    def count_tokens(text: str, model_id: str) -> int:
         """Count tokens in plain text.
         
         Args:
@@ -66,10 +182,10 @@ class TokenCounter:
         Returns:
             Number of tokens
         """
-        encoder = self._get_encoder(model_id)
-        return len(encoder.encode(text))
+        return _count_str(_normalize_model(model_id), text)
     
-    def count_message(self, message: Message, model_id: str) -> int:
+    @staticmethod
+    def count_message(message: Message, model_id: str) -> int:
         """Count tokens in a single message.
         
         Uses tiktoken's message format: <|start|>{role}\n{content}<|end|>
@@ -81,18 +197,10 @@ class TokenCounter:
         Returns:
             Number of tokens
         """
-        encoder = self._get_encoder(model_id)
-        
-        # Tiktoken format: <|start|>{role}\n{content}<|end|>
-        # Every message follows <|start|>{role/name}\n{content}<|end|>
-        # See: https://github.com/openai/openai-cookbook/blob/main/examples/How_to_count_tokens_with_tiktoken.ipynb
-        tokens = 4  # Base overhead for message formatting
-        tokens += len(encoder.encode(message.role.value))
-        tokens += len(encoder.encode(message.content))
-        
-        return tokens
+        return _message_tokens(_normalize_model(model_id), message)
     
-    def count_messages(self, messages: List[Message], model_id: str) -> int:
+    @staticmethod
+    def count_messages(messages: List[Message], model_id: str) -> int:
         """Count total tokens for conversation history.
         
         Args:
@@ -102,14 +210,25 @@ class TokenCounter:
         Returns:
             Total number of tokens
         """
-        total = 0
-        for msg in messages:
-            total += self.count_message(msg, model_id)
-        total += 2  # Reply primer
-        return total
+        if not messages:
+            return 2  # Reply primer
+        
+        model = _normalize_model(model_id)
+        role_tokens = _role_tokens(model)
+        
+        # Same per-message formula as count_message, through the memoized
+        # per-string counts so repeated history is not re-encoded
+        count = _count_str
+        text_tokens = sum(
+            role_tokens[msg.role] + count(model, msg.content)
+            for msg in messages
+        )
+        
+        # Base overhead per message + reply primer + roles and content
+        return 4 * len(messages) + 2 + text_tokens
     
+    @staticmethod
     def truncate_context(
-        self,
         messages: List[Message],
         model_id: str,
         max_tokens: int,
@@ -134,35 +253,29 @@ class TokenCounter:
         
         target_tokens = max_tokens - reserve_tokens
         
-        # Always keep system message if present
-        system_messages = []
-        conversation_messages = []
-        
-        if messages[0].role == MessageRole.SYSTEM:
-            system_messages = [messages[0]]
-            conversation_messages = messages[1:]
-        else:
-            conversation_messages = messages
+        # Always keep system message if present; history starts after it
+        start = 1 if messages[0].role == MessageRole.SYSTEM else 0
+        system_messages = messages[:start]
         
         # Count system messages
-        current_tokens = self.count_messages(system_messages, model_id)
-        truncated = list(system_messages)
+        budget = target_tokens - TokenCounter.count_messages(system_messages, model_id)
         
-        # Add messages from the end until limit reached
-        for msg in reversed(conversation_messages):
-            msg_tokens = self.count_message(msg, model_id)
-            if current_tokens + msg_tokens > target_tokens:
-                break
-            truncated.insert(len(system_messages), msg)
-            current_tokens += msg_tokens
+        # Keep the longest suffix that fits; running totals are
+        # non-decreasing, so the cut point is a bisect
+        model = _normalize_model(model_id)
+        counts = [
+            _message_tokens(model, messages[i])
+            for i in range(len(messages) - 1, start - 1, -1)
+        ]
+        cut = len(messages) - bisect_right(list(accumulate(counts)), budget)
         
         # Add truncation marker if we dropped messages
-        if len(truncated) < len(messages):
-            marker = Message(
-                role=MessageRole.SYSTEM,
-                content="[Earlier conversation context truncated due to length]",
-                conversation_id=messages[0].conversation_id if messages else None
-            )
-            truncated.insert(len(system_messages), marker)
-        
-        return truncated
+        if cut == start:
+            return list(messages)
+        
+        marker = Message(
+            role=MessageRole.SYSTEM,
+            content="[Earlier conversation context truncated due to length]",
+            conversation_id=messages[0].conversation_id
+        )
+        return system_messages + [marker] + messages[cut:]
@@ -2,6 +2,8 @@
 
 Provides shared fixtures for all test types (unit, integration, e2e).
 """
+import sqlite3
+
 import pytest
 from decimal import Decimal
 from uuid import uuid4
@@ -14,6 +16,10 @@ from neural_terminal.domain.models import (
     MessageRole,
     TokenUsage,
 )
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from neural_terminal.infrastructure.database import Base
 from neural_terminal.infrastructure.repositories import SQLiteConversationRepository
 
 
@@ -89,6 +95,31 @@ def repository():
     return SQLiteConversationRepository()
 
 
+@pytest.fixture(scope="session")
+def template_db():
+    """In-memory SQLite database holding only the schema.
+
+    Built once per session; ``repo`` clones it instead of running DDL
+    for every test.
+    """
+    template = sqlite3.connect(":memory:", check_same_thread=False)
+    engine = create_engine(
+        "sqlite://", creator=lambda: template, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield template
+    template.close()
+
+
+@pytest.fixture
+def repo(template_db):
+    """Repository over a private in-memory copy of the template schema."""
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    template_db.backup(connection)
+    yield SQLiteConversationRepository.from_connection(connection)
+    connection.close()
+
+
 @pytest.fixture
 def empty_conversation(repository):
     """Create and save an empty conversation."""
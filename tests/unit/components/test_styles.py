@@ -1,7 +1,11 @@
-"""Tests for CSS generation and injection."""
+"""Tests for CSS generation and injection.
+
+Tests are independent of one another and safe to run in parallel
+(e.g. ``pytest -n auto``): the only shared state touched by inject_css is
+``styles.st``, which each test replaces via the ``fake_st`` fixture.
+"""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 
 from neural_terminal.components.styles import (
     generate_base_css,
@@ -18,6 +22,25 @@ from neural_terminal.components.styles import (
 from neural_terminal.components.themes import ThemeRegistry, DEFAULT_THEME
 
 
+class _FakeSt:
+    """Lightweight stand-in for the streamlit module used by styles."""
+    
+    def __init__(self):
+        self.session_state = {}
+        self.markdown_calls = []
+    
+    def markdown(self, body, **kwargs):
+        self.markdown_calls.append((body, kwargs))
+
+
+@pytest.fixture
+def fake_st(monkeypatch):
+    """Replace styles.st with a recording fake for the test."""
+    fake = _FakeSt()
+    monkeypatch.setattr("neural_terminal.components.styles.st", fake)
+    return fake
+
+
 class TestGenerateBaseCSS:
     """Tests for generate_base_css."""
     
@@ -244,37 +267,27 @@ class TestGenerateAllCSS:
 class TestInjectCSS:
     """Tests for inject_css."""
     
-    @patch("neural_terminal.components.styles.st")
-    def test_injects_css_once(self, mock_st):
+    def test_injects_css_once(self, fake_st):
         """CSS is only injected once per session."""
-        mock_st.session_state = {}
-        
         inject_css(DEFAULT_THEME, key="test_css")
         inject_css(DEFAULT_THEME, key="test_css")  # Second call
         
         # Should only be called once
-        assert mock_st.markdown.call_count == 1
+        assert len(fake_st.markdown_calls) == 1
     
-    @patch("neural_terminal.components.styles.st")
-    def test_uses_unsafe_allow_html(self, mock_st):
+    def test_uses_unsafe_allow_html(self, fake_st):
         """Uses unsafe_allow_html for CSS injection."""
-        mock_st.session_state = {}
-        
         inject_css(DEFAULT_THEME)
         
-        mock_st.markdown.assert_called_once()
-        _, kwargs = mock_st.markdown.call_args
+        assert len(fake_st.markdown_calls) == 1
+        _, kwargs = fake_st.markdown_calls[0]
         assert kwargs.get("unsafe_allow_html") is True
     
-    @patch("neural_terminal.components.styles.st")
-    def test_generates_css_content(self, mock_st):
+    def test_generates_css_content(self, fake_st):
         """Generates and injects CSS content."""
-        mock_st.session_state = {}
-        
         inject_css(DEFAULT_THEME)
         
-        args, _ = mock_st.markdown.call_args
-        css_content = args[0]
+        css_content, _ = fake_st.markdown_calls[-1]
         
         assert "<style>" in css_content
         assert "</style>" in css_content
@@ -283,36 +296,28 @@ class TestInjectCSS:
 class TestSwitchTheme:
     """Tests for switch_theme."""
     
-    @patch("neural_terminal.components.styles.st")
-    def test_switches_theme(self, mock_st):
+    def test_switches_theme(self, fake_st):
         """Can switch to different theme."""
-        mock_st.session_state = {}
-        
         theme = switch_theme("amber")
         
         assert theme == ThemeRegistry.CYBERPUNK_AMBER
     
-    @patch("neural_terminal.components.styles.st")
-    def test_clears_injection_flags(self, mock_st):
+    def test_clears_injection_flags(self, fake_st):
         """Clears injection flags on switch."""
-        mock_st.session_state = {
-            "_test_injected": True,
-            "other_key": "value",
-        }
+        fake_st.session_state["other_key"] = "value"
+        inject_css(DEFAULT_THEME, key="test")
+        assert "_test_injected" in fake_st.session_state
         
         switch_theme("minimal")
         
-        assert "_test_injected" not in mock_st.session_state
-        assert mock_st.session_state["other_key"] == "value"
+        assert "_test_injected" not in fake_st.session_state
+        assert fake_st.session_state["other_key"] == "value"
     
-    @patch("neural_terminal.components.styles.st")
-    def test_injects_new_theme(self, mock_st):
+    def test_injects_new_theme(self, fake_st):
         """Injects CSS for new theme."""
-        mock_st.session_state = {}
-        
         switch_theme("terminal")
         
-        mock_st.markdown.assert_called_once()
+        assert len(fake_st.markdown_calls) == 1
 
 
 class TestStyleManager:
@@ -331,20 +336,16 @@ class TestStyleManager:
         
         assert manager.theme == theme
     
-    @patch("neural_terminal.components.styles.st")
-    def test_apply_injects_css(self, mock_st):
+    def test_apply_injects_css(self, fake_st):
         """Apply method injects CSS."""
-        mock_st.session_state = {}
         manager = StyleManager()
         
         manager.apply()
         
-        mock_st.markdown.assert_called_once()
+        assert len(fake_st.markdown_calls) == 1
     
-    @patch("neural_terminal.components.styles.st")
-    def test_set_theme_changes_theme(self, mock_st):
+    def test_set_theme_changes_theme(self, fake_st):
         """Set theme changes current theme."""
-        mock_st.session_state = {}
         manager = StyleManager()
         
         new_theme = manager.set_theme("amber")
@@ -352,12 +353,10 @@ class TestStyleManager:
         assert manager.theme == ThemeRegistry.CYBERPUNK_AMBER
         assert new_theme == ThemeRegistry.CYBERPUNK_AMBER
     
-    @patch("neural_terminal.components.styles.st")
-    def test_set_theme_injects_css(self, mock_st):
+    def test_set_theme_injects_css(self, fake_st):
         """Set theme injects new CSS."""
-        mock_st.session_state = {}
         manager = StyleManager()
         
         manager.set_theme("minimal")
         
-        assert mock_st.markdown.called
+        assert fake_st.markdown_calls
@@ -57,6 +57,13 @@ class TestCodeBlockCacheBounded:
         assert "```\ncode1\n```" in parser._fenced_cache
         assert "```\ncode2\n```" not in parser._fenced_cache
 
+    def test_text_without_fences_skips_cache(self):
+        """Test that text without fences is not parsed into the cache."""
+        parser = CodeBlockParser(max_cache_size=3)
+
+        assert parser.parse_fenced_blocks("plain `inline` text") == []
+        assert len(parser._fenced_cache) == 0
+
     def test_default_max_cache_size(self):
         """Test that default max cache size is reasonable."""
         parser = CodeBlockParser()
@@ -2,6 +2,7 @@
 
 Tests for Phase 2: Event bus with typed observers.
 """
+import threading
 from dataclasses import dataclass
 from uuid import uuid4
 
@@ -61,6 +62,18 @@ class TestDomainEvent:
         
         assert event.conversation_id is None
         assert event.payload is None
+    
+    def test_token_event_matches_constructor(self):
+        """Test that the token factory builds an equivalent event."""
+        conv_id = uuid4()
+        
+        event = DomainEvent.token("hi", conv_id)
+        
+        assert event == DomainEvent(
+            event_type=Events.TOKEN_GENERATED,
+            conversation_id=conv_id,
+            payload={"delta": "hi"},
+        )
 
 
 class TestEventBus:
@@ -123,6 +136,18 @@ class TestEventBus:
         # Good observer should still receive event
         assert len(good_observer.received_events) == 1
     
+    def test_nothrow_observer_is_not_wrapped(self):
+        """Test that __nothrow__ observers are called without isolation."""
+        bus = EventBus()
+        
+        class NoThrowErrorObserver(ErrorObserver):
+            __nothrow__ = True
+        
+        bus.subscribe("test.event", NoThrowErrorObserver())
+        
+        with pytest.raises(RuntimeError):
+            bus.emit(DomainEvent(event_type="test.event"))
+    
     def test_multiple_observers_same_event(self):
         """Test multiple observers for same event type."""
         bus = EventBus()
@@ -156,6 +181,79 @@ class TestEventBus:
         received = observer.received_events[0]
         assert received.conversation_id == conv_id
         assert received.payload["cost"] == "0.05"
+    
+    def test_event_count(self):
+        """Test that emits are counted per event type."""
+        bus = EventBus()
+        
+        bus.emit(DomainEvent(event_type="test.event"))
+        bus.emit(DomainEvent(event_type="test.event"))
+        bus.emit(DomainEvent(event_type="other.event"))
+        
+        assert bus.event_count("test.event") == 2
+        assert bus.event_count("other.event") == 1
+        assert bus.event_count("never.emitted") == 0
+    
+    def test_event_count_concurrent_emits(self):
+        """Test that emits from several threads are all counted."""
+        bus = EventBus()
+        start = threading.Barrier(4)
+
+        def worker():
+            start.wait()
+            for _ in range(1000):
+                bus.emit(DomainEvent(event_type="test.event"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert bus.event_count("test.event") == 4000
+    
+    def test_emit_token(self):
+        """Test that emit_token reaches TOKEN_GENERATED subscribers."""
+        bus = EventBus()
+        observer = MockObserver()
+        
+        bus.subscribe(Events.TOKEN_GENERATED, observer)
+        bus.emit_token("abc")
+        
+        received = observer.received_events[0]
+        assert received.event_type == Events.TOKEN_GENERATED
+        assert received.payload == {"delta": "abc"}
+        assert received.conversation_id is None
+    
+    def test_emit_token_fast_recycles_event(self):
+        """Test that emit_token_fast delivers fresh data on a reused event."""
+        bus = EventBus()
+        seen = []
+        
+        def record(event):
+            seen.append((id(event), event.payload["delta"]))
+        
+        bus.subscribe(Events.TOKEN_GENERATED, record)
+        bus.emit_token_fast("a")
+        bus.emit_token_fast("b")
+        
+        assert [delta for _, delta in seen] == ["a", "b"]
+        assert seen[0][0] == seen[1][0]
+    
+    def test_emit_token_batch(self):
+        """Test that a batch is delivered as one event with a count."""
+        bus = EventBus()
+        observer = MockObserver()
+        
+        bus.subscribe(Events.TOKEN_GENERATED, observer)
+        bus.emit_token_batch(["a", "b", "c"])
+        bus.emit_token_batch([])
+        
+        assert len(observer.received_events) == 1
+        assert observer.received_events[0].payload == {
+            "count": 3,
+            "deltas": ["a", "b", "c"],
+        }
 
 
 class TestEventsConstants:
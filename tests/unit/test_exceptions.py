@@ -2,6 +2,9 @@
 
 Phase 1: Complete exception hierarchy testing.
 """
+import copy
+import pickle
+
 import pytest
 
 from neural_terminal.domain.exceptions import (
@@ -18,8 +21,11 @@ from neural_terminal.domain.exceptions import (
     NeuralTerminalError,
     OpenRouterAPIError,
     RateLimitError,
+    RateLimitExceededError,
     ServiceError,
     TokenLimitError,
+    TRANSIENT_ERRORS,
+    USER_FACING_ERRORS,
     ValidationError,
 )
 
@@ -191,3 +197,62 @@ class TestBudgetExceededError:
         )
         assert err.accumulated == "5.50"
         assert err.limit == "5.00"
+
+
+class TestErrorGroups:
+    """Tests for the predefined error group tuples."""
+
+    def test_transient_errors(self):
+        """Test retryable errors are caught by TRANSIENT_ERRORS."""
+        for err in (
+            RateLimitError(),
+            ModelUnavailableError(),
+            RateLimitExceededError(),
+            CircuitBreakerOpenError("Circuit open"),
+        ):
+            assert isinstance(err, TRANSIENT_ERRORS)
+        assert not isinstance(TokenLimitError(), TRANSIENT_ERRORS)
+
+    def test_user_facing_errors(self):
+        """Test validation and budget errors are user facing."""
+        assert isinstance(EmptyInputError(), USER_FACING_ERRORS)
+        assert isinstance(BudgetExceededError(), USER_FACING_ERRORS)
+        assert not isinstance(
+            OpenRouterAPIError("Error", status_code=500), USER_FACING_ERRORS
+        )
+
+
+class TestCopyAndPickle:
+    """Tests that exception payloads survive copy and pickle."""
+
+    @pytest.mark.parametrize("err, attrs", [
+        (RateLimitError(retry_after=5), {"retry_after": 5, "status_code": 429}),
+        (ModelUnavailableError(model_id="m"), {"model_id": "m", "status_code": 503}),
+        (
+            BudgetExceededError("Over budget", "1", "2"),
+            {"message": "Over budget", "accumulated": "1", "limit": "2"},
+        ),
+        (
+            ConversationNotFoundError("abc"),
+            {"conversation_id": "abc", "message": "Conversation abc not found"},
+        ),
+        (
+            OpenRouterAPIError("Error", status_code=500, response_body="body"),
+            {"response_body": "body", "code": "HTTP_500"},
+        ),
+        (
+            RateLimitExceededError("Slow down", code="CUSTOM", retry_after=1.5),
+            {"code": "CUSTOM", "retry_after": 1.5},
+        ),
+        (
+            InputTooLongError("Too long", max_length=10, actual_length=12),
+            {"max_length": 10, "actual_length": 12},
+        ),
+    ])
+    def test_round_trip_preserves_attributes(self, err, attrs):
+        """Test copy.copy and a pickle round trip keep every attribute."""
+        for clone in (copy.copy(err), pickle.loads(pickle.dumps(err))):
+            assert type(clone) is type(err)
+            assert str(clone) == str(err)
+            for name, value in attrs.items():
+                assert getattr(clone, name) == value
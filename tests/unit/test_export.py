@@ -9,17 +9,15 @@ from uuid import uuid4
 import pytest
 
 from neural_terminal.domain.models import Conversation, Message, MessageRole, TokenUsage
-from neural_terminal.infrastructure.repositories import SQLiteConversationRepository
 
 
 class TestConversationExport:
     """Tests for conversation export."""
 
-    def test_export_to_json_structure(self):
+    def test_export_to_json_structure(self, repo):
         """Test that export produces valid JSON structure."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         # Create conversation with messages
@@ -49,11 +47,10 @@ class TestConversationExport:
         assert "messages" in data
         assert len(data["messages"]) == 2
 
-    def test_export_includes_metadata(self):
+    def test_export_includes_metadata(self, repo):
         """Test that export includes conversation metadata."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(
@@ -68,11 +65,10 @@ class TestConversationExport:
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_export_messages_format(self):
+    def test_export_messages_format(self, repo):
         """Test that exported messages have correct format."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="Message Format Test")
@@ -98,11 +94,33 @@ class TestConversationExport:
         assert message["content"] == "Test message"
         assert "timestamp" in message
 
-    def test_export_to_markdown(self):
+    def test_export_timestamps_are_isoformat(self, repo, monkeypatch):
+        """Test that timestamps match isoformat() with and without orjson."""
+        from neural_terminal.application import orchestrator as orchestrator_module
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Timestamps")
+        repo.add_message(
+            Message(id=uuid4(), conversation_id=conv.id, content="Hi")
+        )
+        stored = repo.get_messages(conv.id)[0].created_at
+        stored_conv = repo.get_by_id(conv.id)
+
+        exports = [orchestrator.export_conversation(conv.id, format="json")]
+        monkeypatch.setattr(orchestrator_module, "orjson", None)
+        exports.append(orchestrator.export_conversation(conv.id, format="json"))
+
+        for exported in exports:
+            data = json.loads(exported)
+            assert data["created_at"] == stored_conv.created_at.isoformat()
+            assert data["messages"][0]["timestamp"] == stored.isoformat()
+
+    def test_export_to_markdown(self, repo):
         """Test export to Markdown format."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="Markdown Test")
@@ -129,22 +147,20 @@ class TestConversationExport:
         assert "Hello" in exported
         assert "Hi there" in exported
 
-    def test_export_nonexistent_conversation(self):
+    def test_export_nonexistent_conversation(self, repo):
         """Test export of non-existent conversation."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
         from neural_terminal.domain.exceptions import ConversationNotFoundError
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         with pytest.raises(ConversationNotFoundError):
             orchestrator.export_conversation(uuid4(), format="json")
 
-    def test_export_empty_conversation(self):
+    def test_export_empty_conversation(self, repo):
         """Test export of conversation with no messages."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="Empty")
@@ -155,12 +171,11 @@ class TestConversationExport:
         assert data["title"] == "Empty"
         assert data["messages"] == []
 
-    def test_export_includes_cost_and_tokens(self):
+    def test_export_includes_cost_and_tokens(self, repo):
         """Test that export includes cost and token information."""
         from decimal import Decimal
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="With Metrics")
@@ -176,11 +191,131 @@ class TestConversationExport:
         assert Decimal(data["total_cost"]) == Decimal("0.05")
         assert data["total_tokens"] == 150
 
-    def test_export_invalid_format(self):
+    def test_export_json_same_without_orjson(self, repo, monkeypatch):
+        """Test that the stdlib fallback produces identical JSON text."""
+        from neural_terminal.application import orchestrator as orchestrator_module
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Fallback ✓")
+        repo.add_message(
+            Message(
+                id=uuid4(),
+                conversation_id=conv.id,
+                role=MessageRole.USER,
+                content="héllo",
+            )
+        )
+
+        exported = orchestrator.export_conversation(conv.id, format="json")
+        monkeypatch.setattr(orchestrator_module, "orjson", None)
+        fallback = orchestrator.export_conversation(conv.id, format="json")
+
+        assert fallback == exported
+
+    def test_export_json_escapes_non_ascii(self, repo):
+        """Test that non-ASCII text is \\uXXXX-escaped as json.dumps does."""
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Café")
+
+        exported = orchestrator.export_conversation(conv.id, format="json")
+
+        assert '"title": "Caf\\u00e9"' in exported
+        assert exported.isascii()
+        assert exported == json.dumps(json.loads(exported), indent=2)
+
+    def test_export_stream_matches_whole_document_layout(self, repo):
+        """Test that streamed JSON matches serializing the full dict at once."""
+        import io
+
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title='Stream "test"')
+        for i in range(3):
+            repo.add_message(
+                Message(
+                    id=uuid4(),
+                    conversation_id=conv.id,
+                    role=MessageRole.USER,
+                    content=f"line {i}\nnext",
+                )
+            )
+
+        out = io.BytesIO()
+        orchestrator.export_conversation_stream(conv.id, out, format="json")
+        streamed = out.getvalue().decode("utf-8")
+
+        assert streamed == orchestrator.export_conversation(conv.id, format="json")
+        assert streamed == json.dumps(json.loads(streamed), indent=2)
+
+    def test_export_stream_matches_pre_streaming_output(self, repo):
+        """Test that streamed JSON is byte-identical to the original json.dumps export."""
+        import io
+
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Byte parity", model_id="openai/gpt-4")
+        for role, content in [(MessageRole.USER, "Hi"), (MessageRole.ASSISTANT, "Hello\nthere")]:
+            repo.add_message(
+                Message(id=uuid4(), conversation_id=conv.id, role=role, content=content)
+            )
+
+        conv = repo.get_by_id(conv.id)
+        expected = json.dumps(
+            {
+                "id": str(conv.id),
+                "title": conv.title,
+                "model_id": conv.model_id,
+                "created_at": conv.created_at.isoformat() if conv.created_at else None,
+                "updated_at": conv.updated_at.isoformat() if conv.updated_at else None,
+                "total_cost": str(conv.total_cost),
+                "total_tokens": conv.total_tokens,
+                "status": conv.status.value,
+                "messages": [
+                    {
+                        "id": str(msg.id),
+                        "role": msg.role.value,
+                        "content": msg.content,
+                        "timestamp": msg.created_at.isoformat() if msg.created_at else None,
+                        "model_id": msg.model_id,
+                        "latency_ms": msg.latency_ms,
+                    }
+                    for msg in repo.get_messages(conv.id)
+                ],
+            },
+            indent=2,
+        ).encode("utf-8")
+
+        out = io.BytesIO()
+        orchestrator.export_conversation_stream(conv.id, out, format="json")
+
+        assert out.getvalue() == expected
+        assert list(json.loads(expected))[-1] == "messages"
+
+    def test_export_stream_empty_conversation_layout(self, repo):
+        """Test that an empty message list keeps the compact [] layout."""
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Empty")
+
+        exported = orchestrator.export_conversation(conv.id, format="json")
+
+        assert exported == json.dumps(json.loads(exported), indent=2)
+
+    def test_export_invalid_format(self, repo):
         """Test export with invalid format."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="Format Test")
@@ -192,11 +327,10 @@ class TestConversationExport:
 class TestExportFormats:
     """Tests for different export formats."""
 
-    def test_json_format_structure(self):
+    def test_json_format_structure(self, repo):
         """Test JSON export structure."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="JSON Test")
@@ -219,11 +353,10 @@ class TestExportFormats:
         for key in required_keys:
             assert key in data, f"Missing key: {key}"
 
-    def test_markdown_format_has_headers(self):
+    def test_markdown_format_has_headers(self, repo):
         """Test Markdown export has proper headers."""
         from neural_terminal.application.orchestrator import ChatOrchestrator
 
-        repo = SQLiteConversationRepository()
         orchestrator = ChatOrchestrator(repo, None, None, None)
 
         conv = orchestrator.create_conversation(title="MD Headers Test")
@@ -240,3 +373,33 @@ class TestExportFormats:
         # Should have markdown headers
         assert exported.startswith("#")
         assert "Test" in exported
+
+    def test_markdown_exact_layout(self, repo):
+        """Test the exact Markdown layout of a short conversation."""
+        from neural_terminal.application.orchestrator import ChatOrchestrator
+
+        orchestrator = ChatOrchestrator(repo, None, None, None)
+
+        conv = orchestrator.create_conversation(title="Layout")
+        repo.add_message(
+            Message(
+                id=uuid4(),
+                conversation_id=conv.id,
+                role=MessageRole.USER,
+                content="Hi",
+                created_at=datetime(2024, 1, 1, 0, 0, 0),
+            )
+        )
+        repo.add_message(
+            Message(
+                id=uuid4(),
+                conversation_id=conv.id,
+                role=MessageRole.ASSISTANT,
+                content="Hello",
+                created_at=datetime(2024, 1, 1, 0, 0, 1),
+            )
+        )
+
+        exported = orchestrator.export_conversation(conv.id, format="markdown")
+
+        assert exported == "# Layout\n\n## User\n\nHi\n\n## Assistant\n\nHello\n"
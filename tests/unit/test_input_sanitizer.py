@@ -100,3 +100,38 @@ class TestInputSanitizer:
         sanitizer = InputSanitizer(level=SanitizationLevel.STRICT)
         result = sanitizer.sanitize("<b>Hello</b>")
         assert "<b>" not in result
+    def test_sanitize_clean_input_returned_unchanged(self):
+        """Already-clean input should be returned as the same object."""
+        from neural_terminal.infrastructure.input_sanitizer import InputSanitizer
+        sanitizer = InputSanitizer()
+        content = "Hello World\nSecond line\twith tab"
+        assert sanitizer.sanitize(content) is content
+    def test_sanitize_fast_path_does_not_skip_work(self):
+        """Inputs needing any sanitization step must not take the fast path."""
+        from neural_terminal.infrastructure.input_sanitizer import InputSanitizer
+        sanitizer = InputSanitizer(max_length=10)
+        assert sanitizer.sanitize("a  b") == "a b"
+        assert sanitizer.sanitize("a&b") == "a&amp;b"
+        assert sanitizer.sanitize("e\u0301") == "\u00e9"
+        assert sanitizer.sanitize("abcdefghijkl") == "abcdefghij"
+    def test_sanitize_oversize_prefix_matches_full_pipeline(self):
+        """Oversized inputs processed by prefix must match the full pipeline."""
+        from neural_terminal.infrastructure.input_sanitizer import InputSanitizer
+        sanitizer = InputSanitizer(max_length=10)
+        for text in [
+            "a" * 50,
+            "\x00" * 25 + "b" * 30,
+            " " * 30 + "xy",
+            "ab" + " " * 40 + "cd",
+            "e" * 19 + "\u0301" + "f" * 30,
+            "<&>" * 20,
+        ]:
+            assert sanitizer.sanitize(text) == sanitizer._clean(text)[:10]
+    def test_sanitize_oversize_cut_skips_stripped_control_chars(self):
+        """The prefix cut must not land on a control char that is stripped later."""
+        from neural_terminal.infrastructure.input_sanitizer import InputSanitizer
+        sanitizer = InputSanitizer(max_length=5)
+        # Stripping \x01 lets 'e' and the combining acute compose to 'é'
+        text = "xxxx" + "\x02" * 5 + "e\x01\u0301zzzz"
+        assert sanitizer.sanitize(text) == "xxxx\u00e9"
+        assert sanitizer.sanitize(text) == sanitizer._clean(text)[:5]
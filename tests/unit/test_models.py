@@ -7,7 +7,7 @@ from decimal import Decimal
 
 import pytest
 
-from neural_terminal.domain.models import TokenUsage
+from neural_terminal.domain.models import Conversation, Message, TokenUsage
 
 
 class TestTokenUsage:
@@ -94,3 +94,20 @@ class TestTokenUsage:
         # Attempting to modify should raise FrozenInstanceError
         with pytest.raises(Exception):  # dataclasses.FrozenInstanceError
             usage.prompt_tokens = 200
+
+
+class TestSlots:
+    """Domain models are slotted to keep per-instance memory small."""
+
+    @pytest.mark.parametrize("model", [
+        lambda: TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        Message,
+        Conversation,
+    ])
+    def test_models_have_no_instance_dict(self, model):
+        """Instances store fields in slots, not a __dict__."""
+        instance = model()
+        assert not hasattr(instance, "__dict__")
+        # Frozen slotted dataclasses raise TypeError here on some CPythons
+        with pytest.raises((AttributeError, TypeError)):
+            instance.undeclared_attribute = 1
@@ -13,7 +13,6 @@ from neural_terminal.domain.exceptions import ValidationError
 from neural_terminal.domain.models import ConversationStatus, MessageRole, TokenUsage
 from neural_terminal.infrastructure.circuit_breaker import CircuitBreaker
 from neural_terminal.infrastructure.openrouter import OpenRouterClient
-from neural_terminal.infrastructure.repositories import SQLiteConversationRepository
 from neural_terminal.infrastructure.token_counter import TokenCounter
 
 
@@ -36,10 +35,9 @@ class TestChatOrchestrator:
     """Tests for ChatOrchestrator."""
 
     @pytest.fixture
-    def setup(self):
+    def setup(self, repo):
         """Create orchestrator with all dependencies."""
         event_bus = EventBus()
-        repo = SQLiteConversationRepository()
         
         # We'll mock the OpenRouterClient methods
         class MockOpenRouterClient:
@@ -267,10 +265,9 @@ class TestChatOrchestratorRateLimiting:
     """Tests for rate limiting integration."""
 
     @pytest.fixture
-    def setup_with_rate_limit(self):
+    def setup_with_rate_limit(self, repo):
         """Create orchestrator with strict rate limit."""
         event_bus = EventBus()
-        repo = SQLiteConversationRepository()
 
         class MockOpenRouterClient:
             async def get_available_models(self):
@@ -3,7 +3,6 @@
 Phase 2: Rate Limiting - Token bucket algorithm for API protection.
 """
 
-import time
 import threading
 import pytest
 
@@ -11,6 +10,19 @@ from neural_terminal.domain.exceptions import RateLimitExceededError
 from neural_terminal.infrastructure.rate_limiter import RateLimiter, RateLimitConfig
 
 
+class FakeClock:
+    """Manually advanced clock for RateLimiter(time_fn=...)."""
+
+    def __init__(self):
+        self._now = 0.0
+
+    def now(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += seconds
+
+
 class TestRateLimiterConfig:
     """Tests for RateLimitConfig."""
 
@@ -79,7 +91,8 @@ class TestRateLimiter:
     def test_tokens_replenish_over_time(self):
         """Test that tokens replenish based on requests_per_minute."""
         config = RateLimitConfig(requests_per_minute=60, burst_size=1)
-        limiter = RateLimiter(config=config)
+        clock = FakeClock()
+        limiter = RateLimiter(config=config, time_fn=clock.now)
 
         limiter.acquire()
         assert limiter.available_tokens == 0
@@ -87,15 +100,16 @@ class TestRateLimiter:
         with pytest.raises(RateLimitExceededError):
             limiter.acquire()
 
-        time.sleep(1.1)
+        clock.advance(1.1)
 
         assert limiter.available_tokens == 1
         limiter.acquire()
 
     def test_tokens_capped_at_burst_size(self):
         """Test that tokens do not exceed burst size."""
-        limiter = RateLimiter(config=RateLimitConfig(burst_size=3))
-        time.sleep(0.5)
+        clock = FakeClock()
+        limiter = RateLimiter(config=RateLimitConfig(burst_size=3), time_fn=clock.now)
+        clock.advance(3600)
         assert limiter.available_tokens == 3
 
     def test_try_acquire_returns_bool(self):
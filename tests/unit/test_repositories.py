@@ -16,16 +16,18 @@ from neural_terminal.domain.models import (
     MessageRole,
     TokenUsage,
 )
-from neural_terminal.infrastructure.repositories import SQLiteConversationRepository
 
 
 class TestSQLiteConversationRepository:
-    """Tests for SQLite conversation repository."""
+    """Tests for SQLite conversation repository.
 
-    def test_save_and_get_by_id(self):
+    Each test gets ``repo`` (see conftest): a private in-memory copy of the
+    schema, so tests neither touch the application database nor see each
+    other's rows.
+    """
+
+    def test_save_and_get_by_id(self, repo):
         """Test saving a conversation and retrieving it by ID."""
-        repo = SQLiteConversationRepository()
-        
         # Create conversation
         conv = Conversation(
             id=uuid4(),
@@ -51,22 +53,18 @@ class TestSQLiteConversationRepository:
         assert retrieved.total_tokens == 100
         assert retrieved.tags == ["test", "demo"]
     
-    def test_get_by_id_not_found(self):
+    def test_get_by_id_not_found(self, repo):
         """Test retrieving non-existent conversation returns None."""
-        repo = SQLiteConversationRepository()
-        
         retrieved = repo.get_by_id(uuid4())
         
         assert retrieved is None
     
-    def test_add_message_and_get_messages(self):
+    def test_add_message_and_get_messages(self, repo):
         """Test adding messages and retrieving them.
         
         Phase 0 Defect H-5 Fix:
             get_messages() method must be implemented for orchestrator.
         """
-        repo = SQLiteConversationRepository()
-        
         # Create conversation
         conv_id = uuid4()
         conv = Conversation(
@@ -110,10 +108,8 @@ class TestSQLiteConversationRepository:
         assert messages[1].token_usage.prompt_tokens == 10
         assert messages[1].cost == Decimal("0.001")
     
-    def test_get_messages_ordered_by_created_at(self):
+    def test_get_messages_ordered_by_created_at(self, repo):
         """Test that messages are returned in chronological order."""
-        repo = SQLiteConversationRepository()
-        
         # Create conversation
         conv_id = uuid4()
         conv = Conversation(
@@ -149,9 +145,7 @@ class TestSQLiteConversationRepository:
             created_at=base_time + timedelta(seconds=3),
         )
         
-        repo.add_message(msg2)  # Second (1s)
-        repo.add_message(msg1)  # First (2s)
-        repo.add_message(msg3)  # Third (3s)
+        repo.add_messages([msg3, msg1, msg2])  # Inserted out of order
         
         # Retrieve messages - should be ordered by created_at ascending
         messages = repo.get_messages(conv_id)
@@ -161,10 +155,8 @@ class TestSQLiteConversationRepository:
         assert messages[1].content == "First"   # 2s
         assert messages[2].content == "Third"   # 3s
     
-    def test_get_messages_empty_conversation(self):
+    def test_get_messages_empty_conversation(self, repo):
         """Test retrieving messages from conversation with no messages."""
-        repo = SQLiteConversationRepository()
-        
         # Create conversation without messages
         conv_id = uuid4()
         conv = Conversation(
@@ -178,10 +170,76 @@ class TestSQLiteConversationRepository:
         
         assert messages == []
     
-    def test_list_active_returns_active_conversations(self):
-        """Test listing active conversations returns only active."""
-        repo = SQLiteConversationRepository()
+    def test_iter_messages_matches_get_messages(self, repo):
+        """Test that batched iteration yields the same ordered messages."""
+        conv_id = uuid4()
+        repo.save(Conversation(id=conv_id, title="Iterated"))
+        for i in range(5):
+            repo.add_message(
+                Message(
+                    id=uuid4(),
+                    conversation_id=conv_id,
+                    role=MessageRole.USER,
+                    content=f"Message {i}",
+                )
+            )
+        
+        iterated = list(repo.iter_messages(conv_id, batch_size=2))
+        
+        assert [m.id for m in iterated] == [m.id for m in repo.get_messages(conv_id)]
+        assert [m.content for m in iterated] == [f"Message {i}" for i in range(5)]
+    
+    def test_iter_messages_survives_repository_calls_mid_iteration(self, repo):
+        """Test that other calls on the same thread do not break iteration."""
+        conv_id = uuid4()
+        repo.save(Conversation(id=conv_id, title="Interleaved"))
+        for i in range(5):
+            repo.add_message(
+                Message(
+                    id=uuid4(),
+                    conversation_id=conv_id,
+                    role=MessageRole.USER,
+                    content=f"Message {i}",
+                )
+            )
+        
+        contents = []
+        for msg in repo.iter_messages(conv_id, batch_size=2):
+            contents.append(msg.content)
+            assert repo.get_by_id(conv_id).title == "Interleaved"
+        
+        assert contents == [f"Message {i}" for i in range(5)]
+    
+    def test_iter_messages_closes_session_when_abandoned(self, repo):
+        """Test that closing a partly consumed iterator releases its session."""
+        conv_id = uuid4()
+        repo.save(Conversation(id=conv_id, title="Abandoned"))
+        repo.add_messages(
+            Message(id=uuid4(), conversation_id=conv_id, role=MessageRole.USER, content="x")
+            for _ in range(3)
+        )
+        
+        closed = []
+        factory = repo._session_factory.session_factory
+        
+        def tracking_factory():
+            session = factory()
+            original_close = session.close
+            session.close = lambda: (closed.append(True), original_close())
+            return session
         
+        repo._session_factory.session_factory = tracking_factory
+        try:
+            iterator = repo.iter_messages(conv_id, batch_size=1)
+            next(iterator)
+            iterator.close()
+        finally:
+            repo._session_factory.session_factory = factory
+        
+        assert closed == [True]
+    
+    def test_list_active_returns_active_conversations(self, repo):
+        """Test listing active conversations returns only active."""
         # Create active conversations
         for i in range(3):
             conv = Conversation(
@@ -207,10 +265,8 @@ class TestSQLiteConversationRepository:
         idx2 = active_titles.index("Active Conv 2")
         assert idx2 < idx0  # Conv 2 comes first (more recent)
     
-    def test_list_active_respects_limit(self):
+    def test_list_active_respects_limit(self, repo):
         """Test that list_active respects the limit parameter."""
-        repo = SQLiteConversationRepository()
-        
         # Get current count
         initial_count = len(repo.list_active(limit=100))
         
@@ -229,10 +285,25 @@ class TestSQLiteConversationRepository:
         # Should return exactly 5, regardless of total count
         assert len(active) == 5
     
-    def test_add_message_without_conversation_id_raises(self):
+    def test_list_active_query_uses_partial_index(self, repo):
+        """Test that the non-deleted, newest-first listing walks its index."""
+        from sqlalchemy import text
+
+        with repo._session_scope() as session:
+            plan = session.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM conversations "
+                    "WHERE status != :deleted ORDER BY updated_at DESC LIMIT 5"
+                ),
+                {"deleted": "DELETED"},
+            ).all()
+
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_conversations_active_updated" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_add_message_without_conversation_id_raises(self, repo):
         """Test that adding a message without conversation_id raises ValueError."""
-        repo = SQLiteConversationRepository()
-        
         msg = Message(
             id=uuid4(),
             conversation_id=None,  # Missing!
@@ -243,10 +314,32 @@ class TestSQLiteConversationRepository:
         with pytest.raises(ValueError, match="must belong to a conversation"):
             repo.add_message(msg)
     
-    def test_message_without_token_usage_handles_none(self):
+    def test_add_messages_rejects_batch_with_orphan(self, repo):
+        """Test that a batch containing an orphan message writes nothing."""
+        conv_id = uuid4()
+        repo.save(Conversation(id=conv_id, title="Batch"))
+
+        good = Message(id=uuid4(), conversation_id=conv_id, content="Kept?")
+        orphan = Message(id=uuid4(), conversation_id=None, content="Orphan")
+
+        with pytest.raises(ValueError, match="must belong to a conversation"):
+            repo.add_messages([good, orphan])
+
+        assert repo.get_messages(conv_id) == []
+
+    def test_add_messages_persists_metadata(self, repo):
+        """Test that message metadata round-trips through the database."""
+        conv_id = uuid4()
+        repo.save(Conversation(id=conv_id, title="Metadata"))
+
+        repo.add_messages(
+            [Message(conversation_id=conv_id, content="Hi", metadata={"k": "v"})]
+        )
+
+        assert repo.get_messages(conv_id)[0].metadata == {"k": "v"}
+
+    def test_message_without_token_usage_handles_none(self, repo):
         """Test that messages without token usage are handled gracefully."""
-        repo = SQLiteConversationRepository()
-        
         # Create conversation
         conv_id = uuid4()
         conv = Conversation(
@@ -7,7 +7,6 @@ import pytest
 from uuid import uuid4
 
 from neural_terminal.domain.models import Conversation, ConversationStatus, MessageRole
-from neural_terminal.infrastructure.repositories import SQLiteConversationRepository
 
 
 class TestConversationSoftDelete:
@@ -18,9 +17,8 @@ class TestConversationSoftDelete:
         assert hasattr(ConversationStatus, "DELETED")
         assert ConversationStatus.DELETED == "deleted"
 
-    def test_soft_delete_changes_status(self):
+    def test_soft_delete_changes_status(self, repo):
         """Test that soft delete changes conversation status."""
-        repo = SQLiteConversationRepository()
         conv = Conversation(title="Test")
         repo.save(conv)
 
@@ -31,10 +29,8 @@ class TestConversationSoftDelete:
         deleted_conv = repo.get_by_id(conv.id)
         assert deleted_conv.status == ConversationStatus.DELETED
 
-    @pytest.mark.skip(reason="Database isolation issue - test passes in isolation")
-    def test_soft_deleted_conversation_not_in_active_list(self):
+    def test_soft_deleted_conversation_not_in_active_list(self, repo):
         """Test that soft deleted conversation is excluded from active list."""
-        repo = SQLiteConversationRepository()
 
         # Create active conversation
         active = Conversation(title="Active")
@@ -50,9 +46,8 @@ class TestConversationSoftDelete:
         assert len(active_list) == 1
         assert active_list[0].id == active.id
 
-    def test_soft_delete_preserves_conversation_data(self):
+    def test_soft_delete_preserves_conversation_data(self, repo):
         """Test that soft delete preserves conversation data."""
-        repo = SQLiteConversationRepository()
         conv = Conversation(
             title="Important Data",
             model_id="openai/gpt-4",
@@ -73,9 +68,8 @@ class TestConversationSoftDelete:
         assert deleted.total_cost == Decimal("0.5")
         assert deleted.total_tokens == 1000
 
-    def test_soft_delete_preserves_messages(self):
+    def test_soft_delete_preserves_messages(self, repo):
         """Test that soft delete preserves messages."""
-        repo = SQLiteConversationRepository()
         from neural_terminal.domain.models import Message
 
         conv = Conversation(title="With Messages")
@@ -91,8 +85,7 @@ class TestConversationSoftDelete:
             role=MessageRole.ASSISTANT,
             content="Hi",
         )
-        repo.add_message(msg1)
-        repo.add_message(msg2)
+        repo.add_messages([msg1, msg2])
 
         # Soft delete
         repo.soft_delete(conv.id)
@@ -103,9 +96,8 @@ class TestConversationSoftDelete:
         assert messages[0].content == "Hello"
         assert messages[1].content == "Hi"
 
-    def test_restore_soft_deleted_conversation(self):
+    def test_restore_soft_deleted_conversation(self, repo):
         """Test that soft deleted conversation can be restored."""
-        repo = SQLiteConversationRepository()
         conv = Conversation(title="To Restore")
         repo.save(conv)
 
@@ -119,17 +111,14 @@ class TestConversationSoftDelete:
         restored = repo.get_by_id(conv.id)
         assert restored.status == ConversationStatus.ACTIVE
 
-    def test_soft_delete_nonexistent_conversation(self):
+    def test_soft_delete_nonexistent_conversation(self, repo):
         """Test soft delete of non-existent conversation."""
-        repo = SQLiteConversationRepository()
 
         # Should not raise error
         repo.soft_delete(uuid4())
 
-    @pytest.mark.skip(reason="Database isolation issue - test passes in isolation")
-    def test_soft_deleted_conversation_excluded_from_history(self):
+    def test_soft_deleted_conversation_excluded_from_history(self, repo):
         """Test that soft deleted conversation is excluded from history."""
-        repo = SQLiteConversationRepository()
 
         # Create conversations
         conv1 = Conversation(title="Keep")
@@ -149,9 +138,8 @@ class TestConversationSoftDelete:
         assert len(history) == 1
         assert history[0].id == conv1.id
 
-    def test_soft_deleted_conversation_get_by_id(self):
+    def test_soft_deleted_conversation_get_by_id(self, repo):
         """Test that soft deleted conversation can still be retrieved by ID."""
-        repo = SQLiteConversationRepository()
         conv = Conversation(title="Find Me")
         repo.save(conv)
 
@@ -168,7 +156,7 @@ class TestSoftDeleteEvent:
     """Tests for soft delete events."""
 
     @pytest.mark.skip(reason="Event emission not implemented in repository layer")
-    def test_soft_delete_emits_event(self):
+    def test_soft_delete_emits_event(self, repo):
         """Test that soft delete emits an event."""
         from neural_terminal.application.events import EventBus, DomainEvent
 
@@ -180,7 +168,6 @@ class TestSoftDeleteEvent:
 
         event_bus.subscribe("conversation.deleted", track_event)
 
-        repo = SQLiteConversationRepository()
         conv = Conversation(title="Test")
         repo.save(conv)
 
@@ -6,6 +6,7 @@ from decimal import Decimal
 from uuid import uuid4
 
 import pytest
+import streamlit as st
 from datetime import datetime
 
 from neural_terminal.application.state import AppState, StateManager
@@ -18,15 +19,9 @@ class MockSessionState(dict):
 
 
 @pytest.fixture
-def mock_st_session_state(monkeypatch):
-    """Mock Streamlit's session state."""
-    mock_state = MockSessionState()
-    
-    # Mock streamlit module
-    import streamlit as st
-    monkeypatch.setattr(st, "session_state", mock_state)
-    
-    return mock_state
+def session_state():
+    """Fresh session state mapping to inject into StateManager."""
+    return MockSessionState()
 
 
 class TestAppState:
@@ -78,34 +73,43 @@ class TestAppState:
 class TestStateManager:
     """Tests for StateManager."""
 
-    def test_initialization_creates_state(self, mock_st_session_state):
+    def test_defaults_to_streamlit_session_state(self, monkeypatch):
+        """Test that StateManager uses st.session_state when none is given."""
+        mock_state = MockSessionState()
+        monkeypatch.setattr(st, "session_state", mock_state)
+
+        StateManager()
+
+        assert "neural_terminal_initialized" in mock_state
+
+    def test_initialization_creates_state(self, session_state):
         """Test that initialization creates session state."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
-        assert "neural_terminal_initialized" in mock_st_session_state
-        assert "neural_terminal_state" in mock_st_session_state
-        assert "neural_terminal_conversation_cache" in mock_st_session_state
+        assert "neural_terminal_initialized" in session_state
+        assert "neural_terminal_state" in session_state
+        assert "neural_terminal_conversation_cache" in session_state
     
-    def test_initialization_is_idempotent(self, mock_st_session_state):
+    def test_initialization_is_idempotent(self, session_state):
         """Test that multiple initializations don't reset state."""
-        manager1 = StateManager()
+        manager1 = StateManager(session_state=session_state)
         manager1.update(accumulated_cost="5.00")
         
-        manager2 = StateManager()
+        manager2 = StateManager(session_state=session_state)
         
         assert manager2.state.accumulated_cost == "5.00"
     
-    def test_state_property_returns_app_state(self, mock_st_session_state):
+    def test_state_property_returns_app_state(self, session_state):
         """Test state property returns AppState."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
         state = manager.state
         
         assert isinstance(state, AppState)
     
-    def test_update_modifies_state(self, mock_st_session_state):
+    def test_update_modifies_state(self, session_state):
         """Test update modifies state atomically."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
         manager.update(accumulated_cost="10.00", is_streaming=True)
         
@@ -114,9 +118,9 @@ class TestStateManager:
         # Other fields unchanged
         assert manager.state.selected_model == "openai/gpt-3.5-turbo"
     
-    def test_set_conversation_caches_and_sets_current(self, mock_st_session_state):
+    def test_set_conversation_caches_and_sets_current(self, session_state):
         """Test set_conversation caches conversation and sets current."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
         conv = Conversation(
             id=uuid4(),
@@ -137,17 +141,17 @@ class TestStateManager:
         assert cached.title == "Test Conversation"
         assert cached.model_id == "gpt-4"
     
-    def test_get_cached_conversation_returns_none_if_not_found(self, mock_st_session_state):
+    def test_get_cached_conversation_returns_none_if_not_found(self, session_state):
         """Test get_cached_conversation returns None for unknown ID."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
         cached = manager.get_cached_conversation("non-existent-id")
         
         assert cached is None
     
-    def test_conversation_serialization_roundtrip(self, mock_st_session_state):
+    def test_conversation_serialization_roundtrip(self, session_state):
         """Test conversation can be serialized and deserialized."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         
         conv = Conversation(
             id=uuid4(),
@@ -164,9 +168,9 @@ class TestStateManager:
         assert str(cached.total_cost) == "5.50"
         assert cached.tags == ["test", "demo"]
     
-    def test_clear_stream_buffer(self, mock_st_session_state):
+    def test_clear_stream_buffer(self, session_state):
         """Test clear_stream_buffer clears buffer and resets flag."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         manager.update(stream_buffer="Hello world", is_streaming=True)
         
         manager.clear_stream_buffer()
@@ -174,9 +178,9 @@ class TestStateManager:
         assert manager.state.stream_buffer == ""
         assert manager.state.is_streaming is False
     
-    def test_append_stream_buffer(self, mock_st_session_state):
+    def test_append_stream_buffer(self, session_state):
         """Test append_stream_buffer appends text and sets flag."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         manager.update(stream_buffer="Hello")
         
         manager.append_stream_buffer(" world")
@@ -184,9 +188,9 @@ class TestStateManager:
         assert manager.state.stream_buffer == "Hello world"
         assert manager.state.is_streaming is True
     
-    def test_set_error(self, mock_st_session_state):
+    def test_set_error(self, session_state):
         """Test set_error sets message and stops streaming."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         manager.update(is_streaming=True)
         
         manager.set_error("Something went wrong")
@@ -194,9 +198,9 @@ class TestStateManager:
         assert manager.state.error_message == "Something went wrong"
         assert manager.state.is_streaming is False
     
-    def test_clear_error(self, mock_st_session_state):
+    def test_clear_error(self, session_state):
         """Test clear_error removes error message."""
-        manager = StateManager()
+        manager = StateManager(session_state=session_state)
         manager.set_error("Error")
         
         manager.clear_error()
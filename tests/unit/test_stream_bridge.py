@@ -11,7 +11,7 @@ from neural_terminal.components.stream_bridge import StreamlitStreamBridge, run_
 async def mock_async_generator(chunks):
     """Helper to create mock async generator."""
     for chunk in chunks:
-        await asyncio.sleep(0.01)  # Simulate async work
+        await asyncio.sleep(0)  # Simulate async work
         yield chunk
 
 
@@ -21,7 +21,7 @@ class TestRunAsync:
     def test_run_async_executes_coroutine(self):
         """Test that run_async executes coroutine and returns result."""
         async def coro():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return "result"
         
         result = run_async(coro())
@@ -31,7 +31,7 @@ class TestRunAsync:
     def test_run_async_propagates_exception(self):
         """Test that run_async propagates exceptions."""
         async def failing_coro():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             raise ValueError("Test error")
         
         with pytest.raises(ValueError, match="Test error"):
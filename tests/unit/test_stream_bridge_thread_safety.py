@@ -5,7 +5,6 @@ Phase 4: Thread Safety - Ensures safe concurrent access.
 
 import asyncio
 import threading
-import time
 import pytest
 
 from neural_terminal.components.stream_bridge import StreamlitStreamBridge
@@ -14,6 +13,7 @@ from neural_terminal.components.stream_bridge import StreamlitStreamBridge
 class TestStreamlitStreamBridgeThreadSafety:
     """Tests for thread safety of StreamlitStreamBridge."""
 
+    @pytest.mark.slow
     def test_concurrent_buffer_access(self):
         """Test that concurrent buffer access is thread-safe."""
         bridge = StreamlitStreamBridge()
@@ -24,7 +24,7 @@ class TestStreamlitStreamBridgeThreadSafety:
         async def gen():
             for i in range(100):
                 yield (f"chunk{i}", None)
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
             yield ("", {"done": True})
 
         def on_delta(delta):
@@ -45,26 +45,30 @@ class TestStreamlitStreamBridgeThreadSafety:
         async def gen():
             for i in range(50):
                 yield (f"data{i}", None)
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
             yield ("", {"done": True})
 
+        stop = threading.Event()
+
         def check_running():
-            """Simulate concurrent access to _is_running."""
-            for _ in range(100):
+            """Read _is_running continuously until the stream finishes."""
+            while not stop.is_set():
                 try:
                     _ = bridge._is_running
                 except Exception as e:
                     errors.append(str(e))
-                time.sleep(0.001)
 
         # Start checker thread
         checker = threading.Thread(target=check_running)
         checker.start()
 
         # Run stream
-        bridge.stream(gen())
+        try:
+            bridge.stream(gen())
+        finally:
+            stop.set()
 
-        checker.join()
+        checker.join(timeout=1)
 
         assert len(errors) == 0, f"Thread safety errors: {errors}"
 
@@ -83,6 +87,7 @@ class TestStreamlitStreamBridgeThreadSafety:
         assert bridge._error == "Test error"
         assert bridge.content == "partial"
 
+    @pytest.mark.slow
     def test_multiple_concurrent_streams(self):
         """Test that multiple bridges can run concurrently."""
         bridges = [StreamlitStreamBridge() for _ in range(3)]
@@ -91,7 +96,7 @@ class TestStreamlitStreamBridgeThreadSafety:
         async def gen(bridge_id):
             for i in range(10):
                 yield (f"{bridge_id}-{i}", None)
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
             yield ("", {"bridge_id": bridge_id})
 
         def run_stream(bridge, bridge_id):
@@ -132,47 +137,44 @@ class TestStreamlitStreamBridgeThreadSafety:
     def test_queue_operations_thread_safety(self):
         """Test that queue operations remain thread-safe."""
         bridge = StreamlitStreamBridge()
-        errors = []
 
         async def gen():
             for i in range(100):
                 yield (f"item{i}", None)
-                await asyncio.sleep(0.001)
+                await asyncio.sleep(0)
             yield ("", {"done": True})
 
-        def producer_check():
-            """Simulate concurrent queue access."""
-            try:
-                for _ in range(50):
-                    # This shouldn't cause issues as queue is thread-safe
-                    time.sleep(0.01)
-            except Exception as e:
-                errors.append(str(e))
-
-        # Start checker threads
-        threads = [threading.Thread(target=producer_check) for _ in range(2)]
-        for t in threads:
-            t.start()
-
         result = bridge.stream(gen())
 
-        for t in threads:
-            t.join()
-
-        assert len(errors) == 0, f"Queue errors: {errors}"
         assert result == {"done": True}
 
 
 class TestStreamlitStreamBridgeLockSafety:
     """Tests for lock-based thread safety."""
 
-    def test_has_lock_attribute(self):
-        """Test that bridge has a lock for thread safety."""
+    def test_lock_is_mutually_exclusive(self):
+        """Test that the bridge lock excludes other threads while held."""
         bridge = StreamlitStreamBridge()
-        assert hasattr(bridge, "_lock")
-        # threading.Lock() returns a lock object with acquire/release methods
-        assert callable(getattr(bridge._lock, "acquire", None))
-        assert callable(getattr(bridge._lock, "release", None))
+        held = threading.Barrier(2)
+        done = threading.Event()
+
+        def worker():
+            with bridge._lock:
+                held.wait()
+                done.wait(timeout=1.0)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        held.wait()
+
+        # Worker holds the lock, so it must not be acquirable here
+        assert not bridge._lock.acquire(timeout=0.01)
+
+        done.set()
+        t.join()
+
+        assert bridge._lock.acquire(timeout=0.1)
+        bridge._lock.release()
 
     def test_lock_protects_buffer_access(self):
         """Test that lock protects buffer access."""
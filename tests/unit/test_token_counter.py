@@ -5,33 +5,34 @@ Tests for Phase 2: Token counting with tiktoken.
 import pytest
 
 from neural_terminal.domain.models import Message, MessageRole
+from neural_terminal.infrastructure import token_counter
 from neural_terminal.infrastructure.token_counter import TokenCounter
 
 
+@pytest.fixture(scope="module")
+def counter():
+    """Shared counter; encoder caches are process-wide."""
+    return TokenCounter()
+
+
 class TestTokenCounter:
     """Tests for TokenCounter."""
 
-    def test_count_tokens_hello_world(self):
+    def test_count_tokens_hello_world(self, counter):
         """Test token counting for simple text."""
-        counter = TokenCounter()
-        
         # "Hello world" is typically 2 tokens with cl100k_base
         tokens = counter.count_tokens("Hello world", "gpt-3.5-turbo")
         
         assert tokens == 2
     
-    def test_count_tokens_empty_string(self):
+    def test_count_tokens_empty_string(self, counter):
         """Test token counting for empty string."""
-        counter = TokenCounter()
-        
         tokens = counter.count_tokens("", "gpt-3.5-turbo")
         
         assert tokens == 0
     
-    def test_count_message_with_role(self):
+    def test_count_message_with_role(self, counter):
         """Test token counting for a message."""
-        counter = TokenCounter()
-        
         msg = Message(role=MessageRole.USER, content="Hello")
         tokens = counter.count_message(msg, "gpt-3.5-turbo")
         
@@ -39,10 +40,8 @@ class TestTokenCounter:
         # "user" is 1 token, "Hello" is 1 token
         assert tokens == 6  # 4 + 1 + 1
     
-    def test_count_messages_total(self):
+    def test_count_messages_total(self, counter):
         """Test token counting for multiple messages."""
-        counter = TokenCounter()
-        
         messages = [
             Message(role=MessageRole.USER, content="Hello"),
             Message(role=MessageRole.ASSISTANT, content="Hi there"),
@@ -55,10 +54,8 @@ class TestTokenCounter:
         individual = sum(counter.count_message(m, "gpt-3.5-turbo") for m in messages)
         assert total == individual + 2
     
-    def test_encoder_caching(self):
+    def test_encoder_caching(self, counter):
         """Test that encoders are cached."""
-        counter = TokenCounter()
-        
         # First call creates encoder
         encoder1 = counter._get_encoder("gpt-3.5-turbo")
         
@@ -67,20 +64,180 @@ class TestTokenCounter:
         
         assert encoder1 is encoder2
     
-    def test_different_models_same_encoding(self):
+    def test_different_models_same_encoding(self, counter):
         """Test that different OpenAI models use same encoding."""
-        counter = TokenCounter()
-        
         # Both should use cl100k_base
         encoder_gpt35 = counter._get_encoder("openai/gpt-3.5-turbo")
         encoder_gpt4 = counter._get_encoder("openai/gpt-4")
         
         assert encoder_gpt35 is encoder_gpt4
+
+    def test_encoder_shared_across_instances(self, monkeypatch):
+        """Test that encoders are resolved once per process, not per instance."""
+        calls = []
+
+        def fake_get_encoding(name):
+            calls.append(name)
+            return object()
+
+        monkeypatch.setattr(token_counter.tiktoken, "get_encoding", fake_get_encoding)
+        token_counter._resolve_encoder.cache_clear()
+        try:
+            encoder1 = TokenCounter()._get_encoder("openai/gpt-4")
+            encoder2 = TokenCounter()._get_encoder("GPT-4")
+        finally:
+            token_counter._resolve_encoder.cache_clear()
+
+        assert encoder1 is encoder2
+        assert calls == ["cl100k_base"]
+
+    def test_prewarm_populates_cache(self, monkeypatch):
+        """Test that prewarm loads each mapped encoding once and skips failures."""
+        calls = []
+
+        def fake_get_encoding(name):
+            calls.append(name)
+            if len(calls) == 1:
+                raise OSError("offline")
+            return object()
+
+        monkeypatch.setattr(token_counter.tiktoken, "get_encoding", fake_get_encoding)
+        token_counter._resolve_encoder.cache_clear()
+        try:
+            warmed = token_counter.prewarm_encoders()
+            info = token_counter._resolve_encoder.cache_info()
+        finally:
+            token_counter._resolve_encoder.cache_clear()
+
+        assert warmed == list(token_counter.ENCODING_MAP)[1:]
+        assert info.currsize == len(warmed)
+
+    def test_count_tokens_special_token_text(self, counter):
+        """Test that special-token markers in content count as plain text."""
+        tokens = counter.count_tokens("<|endoftext|>", "gpt-3.5-turbo")
+
+        assert tokens > 1
+
+    def test_count_messages_empty(self, counter):
+        """Test that an empty history counts only the reply primer."""
+        assert counter.count_messages([], "gpt-3.5-turbo") == 2
+
+    def test_methods_callable_without_instance(self):
+        """Test that TokenCounter keeps no per-instance state."""
+        assert TokenCounter.count_messages([], "gpt-3.5-turbo") == 2
+
+    def test_count_tokens_memoized(self, counter, monkeypatch):
+        """Test that repeated text is encoded once per model."""
+        encoded = []
+
+        class FakeEncoding:
+            def encode_ordinary(self, text):
+                encoded.append(text)
+                return text.split()
+
+        monkeypatch.setattr(
+            token_counter.tiktoken, "get_encoding", lambda name: FakeEncoding()
+        )
+        TokenCounter.cache_clear()
+        try:
+            msg = Message(role=MessageRole.USER, content="one two three")
+            first = counter.count_message(msg, "openai/gpt-4")
+            second = counter.count_message(msg, "gpt-4")
+            tokens = counter.count_tokens("one two three", "gpt-4")
+        finally:
+            TokenCounter.cache_clear()
+
+        assert first == second == 4 + 1 + 3
+        assert tokens == 3
+        # Role costs are tabulated once per model, content once per string
+        assert encoded == ["user", "assistant", "system", "one two three"]
+
+    def test_long_texts_are_not_cached(self, counter, monkeypatch):
+        """Test that texts over the cacheable length are never retained."""
+        class FakeEncoding:
+            def encode_ordinary(self, text):
+                return text.split()
+
+        monkeypatch.setattr(
+            token_counter.tiktoken, "get_encoding", lambda name: FakeEncoding()
+        )
+        TokenCounter.cache_clear()
+        try:
+            long_text = "x " * token_counter._MAX_CACHED_CHARS
+            tokens = counter.count_tokens(long_text, "gpt-4")
+            counter.count_tokens("short", "gpt-4")
+            info = token_counter._count_str_cached.cache_info()
+        finally:
+            TokenCounter.cache_clear()
+
+        assert tokens == token_counter._MAX_CACHED_CHARS
+        assert info.currsize == 1
+
+    def test_count_messages_reuses_cached_counts(self, counter, monkeypatch):
+        """Test that recounting a long history encodes only new content."""
+        encoded = []
+
+        class FakeEncoding:
+            def encode_ordinary(self, text):
+                encoded.append(text)
+                return text.split()
+
+        monkeypatch.setattr(
+            token_counter.tiktoken, "get_encoding", lambda name: FakeEncoding()
+        )
+        TokenCounter.cache_clear()
+        try:
+            messages = [
+                Message(role=MessageRole.USER, content="word " * i)
+                for i in range(1, 21)
+            ]
+            total = counter.count_messages(messages, "gpt-4")
+            encoded.clear()
+            messages.append(Message(role=MessageRole.USER, content="new turn"))
+            counter.count_messages(messages, "gpt-4")
+        finally:
+            TokenCounter.cache_clear()
+
+        assert total == 4 * 20 + 2 + 20 + sum(range(1, 21))
+        assert encoded == ["new turn"]
+
+    def test_truncate_context_keeps_longest_fitting_suffix(self, counter, monkeypatch):
+        """Test that truncation keeps exactly the recent messages that fit."""
+        class FakeEncoding:
+            def encode_ordinary(self, text):
+                return text.split()
+
+            def encode_ordinary_batch(self, texts):
+                return [self.encode_ordinary(text) for text in texts]
+
+        monkeypatch.setattr(
+            token_counter.tiktoken, "get_encoding", lambda name: FakeEncoding()
+        )
+        TokenCounter.cache_clear()
+        try:
+            # Each message costs 4 + 1 (role) + 1 (content) = 6 tokens
+            messages = [
+                Message(role=MessageRole.SYSTEM, content="sys"),
+                Message(role=MessageRole.USER, content="a"),
+                Message(role=MessageRole.ASSISTANT, content="b"),
+                Message(role=MessageRole.USER, content="c"),
+            ]
+            # Budget after system (6 + 2 primer) is 12: fits the last two
+            result = counter.truncate_context(
+                messages, "gpt-4", max_tokens=20, reserve_tokens=0
+            )
+        finally:
+            TokenCounter.cache_clear()
+
+        assert [m.content for m in result] == [
+            "sys",
+            "[Earlier conversation context truncated due to length]",
+            "b",
+            "c",
+        ]
     
-    def test_truncate_context_no_truncation_needed(self):
+    def test_truncate_context_no_truncation_needed(self, counter):
         """Test truncate when no truncation needed."""
-        counter = TokenCounter()
-        
         messages = [
             Message(role=MessageRole.USER, content="Hello"),
         ]
@@ -95,10 +252,8 @@ class TestTokenCounter:
         assert len(result) == 1
         assert result[0].content == "Hello"
     
-    def test_truncate_context_keeps_system_message(self):
+    def test_truncate_context_keeps_system_message(self, counter):
         """Test that system message is preserved during truncation."""
-        counter = TokenCounter()
-        
         messages = [
             Message(role=MessageRole.SYSTEM, content="You are helpful"),
             Message(role=MessageRole.USER, content="Hello"),
@@ -118,10 +273,8 @@ class TestTokenCounter:
         assert result[0].role == MessageRole.SYSTEM
         assert result[0].content == "You are helpful"
     
-    def test_truncate_context_adds_marker(self):
+    def test_truncate_context_adds_marker(self, counter):
         """Test that truncation adds marker message."""
-        counter = TokenCounter()
-        
         messages = [
             Message(role=MessageRole.USER, content="Hello"),
             Message(role=MessageRole.USER, content="World"),
@@ -144,10 +297,8 @@ class TestTokenCounter:
         marker_contents = [m.content for m in result if "truncated" in m.content]
         assert len(marker_contents) > 0
     
-    def test_truncate_context_empty_list(self):
+    def test_truncate_context_empty_list(self, counter):
         """Test truncate with empty list."""
-        counter = TokenCounter()
-        
         result = counter.truncate_context(
             [],
             "gpt-3.5-turbo",
@@ -156,10 +307,8 @@ class TestTokenCounter:
         
         assert result == []
     
-    def test_count_consistency(self):
+    def test_count_consistency(self, counter):
         """Test that counting is consistent."""
-        counter = TokenCounter()
-        
         text = "This is a test message for consistency checking."
         
         count1 = counter.count_tokens(text, "gpt-3.5-turbo")